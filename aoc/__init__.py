@@ -0,0 +1,8 @@
+"""
+  Shared tooling around the yearly solutions.
+
+  The year packages only know how to solve a single day. Everything
+  that runs, times or otherwise drives those solutions lives here,
+  so the riddles themselves can stay small and self-contained.
+
+"""
@@ -0,0 +1,121 @@
+"""
+  Keeps the answers of earlier runs on disk.
+
+  An answer is found back with a hash of the input file of the
+  day together with the source of its week module and of the aoc
+  modules that uses, like parsing and search. Changing any of them
+  solves the day again, so do the grammars at module level and the
+  shared helpers. Editing another week doesn't.
+
+  Old entries are evicted by age and by the total size of the cache.
+
+"""
+import hashlib
+import inspect
+import os
+import pathlib
+import pickle
+import time
+import types
+
+from . import registry
+
+DEFAULT_DIRECTORY = registry.ROOT.joinpath(".aoc_cache", "answers")
+MAX_BYTES = 64 * 1024 * 1024
+MAX_AGE = 30 * 24 * 3600
+
+
+def input_path(year, day):
+    """ The day_N.txt input of the day, None for days without input file """
+    solver = registry.solver(year, day)
+    path = inspect.getmodule(solver).get_filepath(f"day_{day}.txt")
+    return path if path.exists() else None
+
+
+def _used_modules(module):
+    """ module and the aoc modules it uses, directly or not, by name """
+    found = {}
+    todo = [module]
+    while todo:
+        module = todo.pop()
+        if module.__name__ in found:
+            continue
+        found[module.__name__] = module
+        todo.extend(value for value in vars(module).values()
+                    if isinstance(value, types.ModuleType)
+                    and value.__name__.partition(".")[0] == "aoc")
+    return [found[name] for name in sorted(found)]
+
+
+def cache_key(year, day):
+    solver = registry.solver(year, day)
+    digest = hashlib.sha256(f"{year}/{day}\n".encode())
+    for module in _used_modules(inspect.getmodule(solver)):
+        digest.update(f"{module.__name__}\n".encode())
+        digest.update(inspect.getsource(module).encode())
+    if path := input_path(year, day):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def load(key, directory=DEFAULT_DIRECTORY):
+    """ Returns (True, answer) when the key is known, otherwise (False, None) """
+    path = pathlib.Path(directory, f"{key}.pickle")
+    try:
+        with open(path, "rb") as f:
+            answer = pickle.load(f)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        return False, None
+    # Using the access as the age keeps the often used answers around.
+    os.utime(path)
+    return True, answer
+
+
+def store(key, answer, directory=DEFAULT_DIRECTORY):
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    temporary = directory.joinpath(f"{key}.{os.getpid()}.tmp")
+    with open(temporary, "wb") as f:
+        pickle.dump(answer, f)
+    # Several processes of the pool can finish at the same time.
+    os.replace(temporary, directory.joinpath(f"{key}.pickle"))
+
+
+def evict(directory=DEFAULT_DIRECTORY, max_bytes=MAX_BYTES, max_age=MAX_AGE,
+          pattern="*.pickle"):
+    """ Removes entries older than max_age, then the oldest until
+        the cache fits in max_bytes.
+    """
+    entries = []
+    now = time.time()
+    for path in pathlib.Path(directory).glob(pattern):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        if now - stat.st_mtime > max_age:
+            path.unlink(missing_ok=True)
+        else:
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def clear(directory=DEFAULT_DIRECTORY):
+    for path in pathlib.Path(directory).glob("*.pickle"):
+        path.unlink(missing_ok=True)
+
+
+def cached(year, day, solve, directory=DEFAULT_DIRECTORY):
+    """ Returns the answer of solve(), unless it was stored before """
+    key = cache_key(year, day)
+    found, answer = load(key, directory)
+    if not found:
+        answer = solve()
+        store(key, answer, directory)
+    return answer
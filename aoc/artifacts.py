@@ -0,0 +1,169 @@
+"""
+  Keeps parsed inputs on disk between runs.
+
+  Some days spend a good part of their time turning the text into
+  structures. Those structures are stored, keyed by a hash of the
+  input together with the name and version of the parser, its code
+  and the source of its module. Later runs on the same input, even
+  with other parameters, load them instead of parsing again. Editing
+  the parser or anything else in its module changes the key, bump the
+  version after changing a helper of another module it calls.
+
+  Only inputs read from files are stored. Content given directly and
+  open files (like stdin) are parsed every time, storing them would
+  only fill the directory with one-off artifacts.
+
+  Only plain data (tuples, dicts, str, int, ...) should be stored,
+  no closures. It is written with marshal, or pickle for data marshal
+  doesn't know. Old artifacts are evicted like the cached answers.
+
+"""
+import contextlib
+import hashlib
+import inspect
+import marshal
+import os
+import pathlib
+import pickle
+
+from . import answer_cache
+from . import inputs
+from . import registry
+
+DEFAULT_DIRECTORY = registry.ROOT.joinpath(".aoc_cache", "artifacts")
+MAX_BYTES = 256 * 1024 * 1024
+SUFFIX = ".artifact"
+
+MARSHAL = b"m"
+PICKLE = b"p"
+
+_redirects = []
+
+
+@contextlib.contextmanager
+def redirected(directory):
+    """ Keeps the artifacts in directory instead, while in the with """
+    _redirects.append(pathlib.Path(directory))
+    try:
+        yield
+    finally:
+        _redirects.pop()
+
+
+def _directory(directory):
+    """ directory, or the one to use when it is None """
+    if directory is not None:
+        return pathlib.Path(directory)
+    return _redirects[-1] if _redirects else DEFAULT_DIRECTORY
+
+
+def code_digest(*functions):
+    """ A hash of the functions and of the source of their modules.
+
+        The bytecode, constants and names used of the functions and
+        their inner functions are hashed. The module source covers the
+        functions they call, like the other inner functions of a
+        solve_day_* or the grammars at module level.
+    """
+    digest = hashlib.sha256()
+    modules = set()
+    codes = []
+    for function in functions:
+        if not hasattr(function, "__code__"):
+            continue
+        codes.append(function.__code__)
+        module = inspect.getmodule(function)
+        if module is not None and module not in modules:
+            modules.add(module)
+            try:
+                digest.update(inspect.getsource(module).encode())
+            except (OSError, TypeError):
+                # Without a source file (like the interpreter's
+                # __main__) the code itself has to do.
+                pass
+    while codes:
+        code = codes.pop()
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode())
+        for const in code.co_consts:
+            if isinstance(const, type(code)):
+                codes.append(const)
+            else:
+                digest.update(repr(const).encode())
+    return digest.hexdigest()
+
+
+def artifact_key(name, version, text, code=""):
+    digest = hashlib.sha256(f"{name}\n{version}\n{code}\n".encode())
+    digest.update(text.encode())
+    return digest.hexdigest()
+
+
+def _serialize(data):
+    try:
+        return MARSHAL + marshal.dumps(data)
+    except ValueError:
+        return PICKLE + pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _deserialize(raw):
+    kind, payload = raw[:1], raw[1:]
+    if kind == MARSHAL:
+        return marshal.loads(payload)
+    return pickle.loads(payload)
+
+
+def load(key, directory=None):
+    """ Returns (True, data) when the key is stored, otherwise (False, None) """
+    directory = _directory(directory)
+    path = pathlib.Path(directory, f"{key}{SUFFIX}")
+    try:
+        data = _deserialize(path.read_bytes())
+    except (FileNotFoundError, EOFError, ValueError, TypeError,
+            pickle.UnpicklingError):
+        return False, None
+    os.utime(path)
+    return True, data
+
+
+def store(key, data, directory=None):
+    directory = _directory(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    temporary = directory.joinpath(f"{key}.{os.getpid()}.tmp")
+    temporary.write_bytes(_serialize(data))
+    os.replace(temporary, directory.joinpath(f"{key}{SUFFIX}"))
+    answer_cache.evict(directory, max_bytes=MAX_BYTES, pattern=f"*{SUFFIX}")
+
+
+def parsed(puzzle_input, parser, name=None, version=0,
+           directory=None):
+    """ parser(text), loaded from disk when this input was parsed before.
+
+        Within a process the result is also remembered like
+        inputs.parsed does. name defaults to the qualified name of
+        the parser. The result is shared, it shouldn't be modified.
+        Only a path is looked up on disk, other inputs are just parsed.
+    """
+    if name is None:
+        name = f"{parser.__module__}.{parser.__qualname__}"
+    if not isinstance(puzzle_input, os.PathLike):
+        return inputs.parsed(puzzle_input, parser,
+                             key=("artifact", name, version))
+    code = code_digest(parser)
+
+    def load_or_parse(text):
+        key = artifact_key(name, version, text, code)
+        found, data = load(key, directory)
+        if not found:
+            data = parser(text)
+            store(key, data, directory)
+        return data
+
+    return inputs.parsed(puzzle_input, load_or_parse,
+                         key=("artifact", name, version))
+
+
+def clear(directory=None):
+    directory = _directory(directory)
+    for path in pathlib.Path(directory).glob(f"*{SUFFIX}"):
+        path.unlink(missing_ok=True)
@@ -0,0 +1,124 @@
+"""
+  Solves many inputs per day in a single run.
+
+  The inputs are files laid out per year and day:
+    inputs/2015/7/alice.txt
+    inputs/2015/7/bob.txt
+    inputs/2016/9/alice.txt
+  Every process imports the days it needs once, so patterns are
+  compiled once, after which each input only costs its solve. An
+  input is forgotten once solved, the memory stays flat however many
+  inputs there are. The answers are written as JSON lines as soon as
+  they are known, in the format of the daemon plus the input path:
+    {"year": 2015, "day": 7, "answer": [16076, 2797], "seconds": 0.01,
+     "input": "inputs/2015/7/alice.txt"}
+
+  Usage:
+    python3 -m aoc.batch inputs/ --jobs 4 > answers.jsonl
+"""
+import argparse
+import concurrent.futures
+import os
+import json
+import pathlib
+import sys
+
+from . import daemon
+from . import inputs
+from . import md5mining
+from . import registry
+
+
+def find_inputs(directory, year=None, day=None):
+    """ (year, day, path) of every input file under directory """
+    found = []
+    for path in sorted(pathlib.Path(directory).glob("*/*/*")):
+        if not path.is_file():
+            continue
+        try:
+            path_year = int(path.parent.parent.name)
+            path_day = int(path.parent.name)
+        except ValueError:
+            continue
+        if year is not None and path_year != year:
+            continue
+        if day is not None and path_day != day:
+            continue
+        found.append((path_year, path_day, path))
+    return found
+
+
+def warm(days, mining_workers=None):
+    """ Imports the solutions of days, once per process.
+
+        Unknown days are left to solve_input to report.
+    """
+    md5mining.set_workers(mining_workers)
+    known = set(registry.days())
+    for year, day in days:
+        if (year, day) in known:
+            registry.solver(year, day)
+
+
+def solve_input(year, day, path):
+    """ Solves one input, forgetting it afterwards.
+
+        Every input is read once, remembering them all would only
+        grow the process.
+    """
+    try:
+        response = daemon.solve_request({"year": year, "day": day,
+                                         "path": path})
+    finally:
+        inputs.clear()
+    response["input"] = str(path)
+    return response
+
+
+def solve_all(found, workers=None):
+    """ Yields a response per input as soon as it is solved.
+
+        workers of None solves in this process, 0 uses all cores.
+    """
+    days = sorted({(year, day) for year, day, _ in found})
+    if workers is None:
+        warm(days)
+        for year, day, path in found:
+            yield solve_input(year, day, path)
+        return
+
+    parallel = workers or os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=parallel, initializer=warm,
+            initargs=(days, md5mining.share(parallel))) as pool:
+        futures = [
+            pool.submit(solve_input, year, day, path)
+            for year, day, path in found
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("directory",
+                        help="holds the inputs as YEAR/DAY/any_name")
+    parser.add_argument("--year", type=int)
+    parser.add_argument("--day", type=int)
+    parser.add_argument(
+        "-j", "--jobs", type=int, nargs="?", const=0, default=None,
+        help="solve on this many processes (all cores when no count is given)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    found = find_inputs(args.directory, args.year, args.day)
+    if not found:
+        sys.exit(f"No inputs found in {args.directory}")
+    for response in solve_all(found, args.jobs):
+        print(json.dumps(response), flush=True)
+
+
+if __name__ == "__main__":
+    main()
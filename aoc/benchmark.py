@@ -0,0 +1,164 @@
+"""
+  Benchmarks every solve_day_* function.
+
+  Each day is run a few times after some warmup runs, the wall
+  times are summarised as min/median/p95. Peak memory is measured
+  in a separate run with tracemalloc, as tracing slows the solutions
+  down too much to trust the timings of that run.
+
+  Every run starts cold: the inputs read and the memos of earlier
+  runs are forgotten first, and the parsed artifacts and checkpoints
+  go to an empty temporary directory. Otherwise only the first run
+  would do the work. The cache in .aoc_cache is left alone.
+
+  Usage:
+    python3 -m aoc.benchmark run --repeat 5 --output new.json
+    python3 -m aoc.benchmark compare old.json new.json
+"""
+import argparse
+import contextlib
+import json
+import math
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from . import artifacts
+from . import checkpoint
+from . import inputs
+from . import memo
+from . import registry
+
+
+def percentile(samples, fraction):
+    """ Nearest-rank percentile of the samples """
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+@contextlib.contextmanager
+def cold():
+    """ Runs without what earlier runs left behind """
+    inputs.clear()
+    memo.clear()
+    with tempfile.TemporaryDirectory() as directory, \
+            artifacts.redirected(f"{directory}/artifacts"), \
+            checkpoint.redirected(f"{directory}/checkpoints"):
+        yield
+
+
+def peak_memory(solver):
+    """ Peak of the memory allocated by python while solving """
+    with cold():
+        tracemalloc.start()
+        try:
+            solver()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return peak
+
+
+def measure(solver, repeat, warmup):
+    for _ in range(warmup):
+        with cold():
+            solver()
+
+    samples = []
+    for _ in range(repeat):
+        with cold():
+            start = time.perf_counter()
+            solver()
+            samples.append(time.perf_counter() - start)
+
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 0.95),
+        "peak_memory": peak_memory(solver),
+        "samples": samples,
+    }
+
+
+def run(jobs, repeat, warmup):
+    days = {}
+    for year, day in jobs:
+        label = registry.label(year, day)
+        days[label] = measure(registry.solver(year, day), repeat, warmup)
+        print(f"{label}: median {days[label]['median']:.3f}s", file=sys.stderr)
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "warmup": warmup,
+        "days": days,
+    }
+
+
+def compare(baseline, current, threshold):
+    """ Returns the days whose median got slower than threshold allows.
+
+        threshold is relative, 0.1 flags a day that got 10% slower.
+    """
+    regressions = []
+    for label, stats in current["days"].items():
+        if label not in baseline["days"]:
+            continue
+        before = baseline["days"][label]["median"]
+        after = stats["median"]
+        if after > before * (1 + threshold):
+            regressions.append((label, before, after))
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="time the solutions")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--year", type=int)
+    run_parser.add_argument("--day", type=int)
+    run_parser.add_argument("--output", default="benchmark.json")
+
+    compare_parser = commands.add_parser(
+        "compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="relative slowdown of the median to flag (default 0.1)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == "run":
+        try:
+            jobs = registry.select(args.year, args.day)
+        except LookupError as error:
+            sys.exit(str(error))
+        report = run(jobs, args.repeat, args.warmup)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        for label, before, after in regressions:
+            print(f"{label}: {before:.3f}s -> {after:.3f}s "
+                  f"({after / before - 1:+.0%})")
+        if regressions:
+            sys.exit(1)
+        print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
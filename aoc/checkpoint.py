@@ -0,0 +1,102 @@
+"""
+  Lets long running loops continue where a killed run stopped.
+
+  A loop saves its position and partial results every few seconds
+  under a name made from the day and its input. A new run on the same
+  input loads that state and continues from there, so a kill costs at
+  most the last few seconds of work. The checkpoint is removed once
+  the loop is done.
+
+  The state is pickled, it should only hold plain data. Saving is
+  skipped until INTERVAL seconds passed since the last save, so the
+  loops can offer their state on every step.
+
+"""
+import contextlib
+import hashlib
+import os
+import pathlib
+import pickle
+import time
+
+from . import answer_cache
+from . import registry
+
+DEFAULT_DIRECTORY = registry.ROOT.joinpath(".aoc_cache", "checkpoints")
+INTERVAL = 10.0
+MAX_BYTES = 256 * 1024 * 1024
+SUFFIX = ".checkpoint"
+
+_redirects = []
+
+
+@contextlib.contextmanager
+def redirected(directory):
+    """ Keeps the checkpoints in directory instead, while in the with """
+    _redirects.append(pathlib.Path(directory))
+    try:
+        yield
+    finally:
+        _redirects.pop()
+
+
+def _directory(directory):
+    """ directory, or the one to use when it is None """
+    if directory is not None:
+        return pathlib.Path(directory)
+    return _redirects[-1] if _redirects else DEFAULT_DIRECTORY
+
+
+def checkpoint_name(label, *parameters):
+    """ A file name for the loop label with these parameters """
+    digest = hashlib.sha256(repr(parameters).encode()).hexdigest()
+    return f"{label.replace('/', '-')}-{digest[:16]}"
+
+
+def load(name, directory=None):
+    """ The saved state, None when there is none """
+    directory = _directory(directory)
+    path = pathlib.Path(directory, f"{name}{SUFFIX}")
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def save(name, state, directory=None):
+    directory = _directory(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    temporary = directory.joinpath(f"{name}.{os.getpid()}.tmp")
+    with open(temporary, "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    # A kill halfway a save keeps the previous checkpoint intact.
+    os.replace(temporary, directory.joinpath(f"{name}{SUFFIX}"))
+    answer_cache.evict(directory, max_bytes=MAX_BYTES, pattern=f"*{SUFFIX}")
+
+
+def remove(name, directory=None):
+    directory = _directory(directory)
+    pathlib.Path(directory, f"{name}{SUFFIX}").unlink(missing_ok=True)
+
+
+def periodic(name, interval=INTERVAL, directory=None):
+    """ A offer(make_state) that saves make_state() at most once per
+        interval seconds. make_state is only called when it is saved.
+    """
+    last_save = time.monotonic()
+
+    def offer(make_state):
+        nonlocal last_save
+        now = time.monotonic()
+        if now - last_save >= interval:
+            save(name, make_state(), directory)
+            last_save = time.monotonic()
+
+    return offer
+
+
+def clear(directory=None):
+    directory = _directory(directory)
+    for path in pathlib.Path(directory).glob(f"*{SUFFIX}"):
+        path.unlink(missing_ok=True)
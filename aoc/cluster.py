@@ -0,0 +1,266 @@
+"""
+  Spreads the days over workers on several machines.
+
+  A worker is the daemon over TCP: it imports every solution once and
+  answers the same JSON lines (see daemon.py). Without "input" a job
+  is solved on the input files of the worker's own checkout. Unlike
+  the daemon, a worker refuses "path": anyone who can connect could
+  otherwise have it read any file. Workers listen on localhost unless
+  --host says otherwise, there is no authentication.
+
+  The coordinator deals the jobs out over the workers, longest first
+  by the durations of earlier runs. A worker takes jobs from the front
+  of its own queue; once that is empty it steals from the back of the
+  fullest queue of another worker. The jobs of a worker that went
+  away are stolen by the others.
+
+  Usage:
+    python3 -m aoc.cluster worker --host '' --port 7000  (every machine)
+    python3 -m aoc.cluster run --workers alpha:7000,beta:7000 2015
+    python3 -m aoc.cluster run --local 3 2016  (workers on localhost)
+"""
+import argparse
+import collections
+import json
+import multiprocessing
+import queue
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+from . import daemon
+from . import md5mining
+from . import registry
+from . import scheduler
+
+DEFAULT_PORT = 7000
+CONNECT_TIMEOUT = 10.0
+
+Job = collections.namedtuple("Job", "year day input")
+
+
+class WorkerServer(socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+class WorkerHandler(daemon.RequestHandler):
+    allow_paths = False
+
+
+def serve(host="localhost", port=DEFAULT_PORT, mining_workers=None):
+    """ Serves jobs until interrupted.
+
+        Like the daemon, one connection and one job at a time. Another
+        coordinator waits until the current one is done. The md5
+        mining uses mining_workers processes, all cores when None.
+    """
+    md5mining.set_workers(mining_workers)
+    daemon.preload()
+    with WorkerServer((host, port), WorkerHandler) as server:
+        print(f"Worker listening on {host or '*'}:{port}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def parse_address(address):
+    host, _, port = address.rpartition(":")
+    return host or "localhost", int(port)
+
+
+def connect(address, timeout=CONNECT_TIMEOUT):
+    """ Connects to a worker, retrying while it is starting up """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return socket.create_connection(parse_address(address))
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.1)
+
+
+class WorkQueues(object):
+    """ A queue of jobs per worker, idle workers steal from the others """
+
+    def __init__(self, jobs, workers):
+        self._lock = threading.Lock()
+        self._queues = {worker: collections.deque() for worker in workers}
+        for idx, job in enumerate(jobs):
+            self._queues[workers[idx % len(workers)]].append(job)
+
+    def take(self, worker):
+        """ (job, stolen), job is None when no work is left """
+        with self._lock:
+            own = self._queues[worker]
+            if own:
+                return own.popleft(), False
+            victim = max(self._queues.values(), key=len)
+            if victim:
+                return victim.pop(), True
+            return None, False
+
+    def give_back(self, worker, job):
+        with self._lock:
+            self._queues[worker].appendleft(job)
+
+    def remaining(self):
+        with self._lock:
+            return [job for jobs in self._queues.values() for job in jobs]
+
+
+def _message(job):
+    message = {"year": job.year, "day": job.day}
+    if job.input is not None:
+        message["input"] = job.input
+    return message
+
+
+def _work(address, work_queues, results):
+    try:
+        connection = connect(address)
+    except OSError as error:
+        results.put(("lost", address, repr(error)))
+        return
+    with connection, connection.makefile("rwb") as stream:
+        while True:
+            job, stolen = work_queues.take(address)
+            if job is None:
+                break
+            try:
+                stream.write((json.dumps(_message(job)) + "\n").encode())
+                stream.flush()
+                line = stream.readline()
+            except OSError:
+                line = b""
+            if not line:
+                # Left for the other workers to steal.
+                work_queues.give_back(address, job)
+                results.put(("lost", address, "connection closed"))
+                return
+            results.put(("done", address, (job, stolen, json.loads(line))))
+    results.put(("finished", address, None))
+
+
+def run(jobs, addresses):
+    """ Solves the jobs on the workers at addresses.
+
+        Yields (job, worker, stolen, response) as the jobs complete,
+        with the daemon's response. A job given back by a lost worker
+        after all others stopped gets an "error" response.
+    """
+    work_queues = WorkQueues(jobs, addresses)
+    results = queue.Queue()
+    for address in addresses:
+        threading.Thread(target=_work,
+                         args=(address, work_queues, results),
+                         daemon=True).start()
+
+    active = len(addresses)
+    while active:
+        status, address, payload = results.get()
+        if status == "done":
+            job, stolen, response = payload
+            yield job, address, stolen, response
+        else:
+            if status == "lost":
+                print(f"Lost worker {address}: {payload}", file=sys.stderr)
+            active -= 1
+
+    for job in work_queues.remaining():
+        yield job, None, False, {"year": job.year, "day": job.day,
+                                 "error": "no workers left"}
+
+
+def start_local_workers(count):
+    """ Starts count workers on localhost.
+
+        Returns their addresses and processes, the processes are left
+        to the caller to terminate.
+    """
+    addresses = []
+    processes = []
+    for _ in range(count):
+        # The port is only known free until it's closed, good enough
+        # for trying out the cluster on a single machine.
+        with socket.socket() as probe:
+            probe.bind(("localhost", 0))
+            port = probe.getsockname()[1]
+        # Not daemonic, the days may start processes of their own.
+        worker = multiprocessing.Process(
+            target=serve, args=("localhost", port, md5mining.share(count)))
+        worker.start()
+        addresses.append(f"localhost:{port}")
+        processes.append(worker)
+    return addresses, processes
+
+
+def solve(jobs, addresses):
+    """ Prints the answers as they complete, returns the failed jobs """
+    failed = []
+    for job, worker, stolen, response in run(jobs, addresses):
+        label = registry.label(job.year, job.day)
+        if "error" in response:
+            print(f"{label}: {response['error']}")
+            failed.append(job)
+            continue
+        answer = response["answer"]
+        if isinstance(answer, list):
+            answer = tuple(answer)
+        how = "stolen by" if stolen else "on"
+        print(f"{label}: {answer} ({response['seconds']:.2f}s {how} {worker})")
+    return failed
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    worker_parser = commands.add_parser("worker", help="serve jobs")
+    worker_parser.add_argument(
+        "--host", default="localhost",
+        help="interface to listen on, '' for all (no authentication!)")
+    worker_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    run_parser = commands.add_parser("run", help="solve days on workers")
+    run_parser.add_argument("year", type=int, nargs="?")
+    run_parser.add_argument("day", type=int, nargs="?")
+    where = run_parser.add_mutually_exclusive_group(required=True)
+    where.add_argument("--workers",
+                       help="comma separated host:port of the workers")
+    where.add_argument("--local", type=int, metavar="COUNT",
+                       help="start this many workers on localhost")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == "worker":
+        serve(args.host, args.port)
+        return
+
+    try:
+        days = registry.select(args.year, args.day)
+    except LookupError as error:
+        sys.exit(str(error))
+    days = scheduler.longest_first(days, scheduler.load_history())
+    jobs = [Job(year, day, None) for year, day in days]
+    processes = []
+    if args.local:
+        addresses, processes = start_local_workers(args.local)
+    else:
+        addresses = args.workers.split(",")
+    try:
+        failed = solve(jobs, addresses)
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+    if failed:
+        sys.exit(f"{len(failed)} days failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+  A long running process that solves days on request.
+
+  Every solution is imported once when the daemon starts. Inputs
+  parsed before and the caches of the solutions (e.g. the hashes of
+  2016 day 5) stay in memory between requests.
+
+  The protocol is one JSON object per line over a Unix socket:
+    -> {"year": 2016, "day": 9, "input": "(3x3)XYZ"}
+    <- {"year": 2016, "day": 9, "answer": [9, 9], "seconds": 0.0001}
+  Without "input" the day solves its own input file, with "path"
+  it reads that file instead. A connection can send several requests.
+  Errors are answered with {"error": "..."}.
+
+  Usage:
+    python3 -m aoc.daemon serve
+    python3 -m aoc.daemon solve 2016 9 --input -
+"""
+import argparse
+import json
+import os
+import pathlib
+import socket
+import socketserver
+import sys
+
+from . import metrics
+from . import registry
+
+DEFAULT_SOCKET = registry.ROOT.joinpath(".aoc_cache", "daemon.sock")
+
+
+def solve_request(message):
+    """ Solves a single request, returns the response """
+    try:
+        year = int(message["year"])
+        day = int(message["day"])
+        solver = registry.solver(year, day)
+    except (KeyError, TypeError, ValueError, LookupError) as error:
+        return {"error": f"bad request: {error}"}
+
+    puzzle_input = None
+    if "input" in message:
+        puzzle_input = message["input"]
+    elif "path" in message:
+        puzzle_input = pathlib.Path(message["path"])
+
+    try:
+        call = metrics.measure(year, day, lambda: solver(puzzle_input))
+    except Exception as error:
+        return {"year": year, "day": day, "error": repr(error)}
+    metrics.record(call)
+    return {
+        "year": year,
+        "day": day,
+        "answer": call.result,
+        "seconds": call.wall,
+    }
+
+
+def handle_line(line, allow_paths=True):
+    """ One line of the protocol in, one line out.
+
+        Without allow_paths, requests naming a "path" are refused.
+    """
+    try:
+        message = json.loads(line)
+    except ValueError as error:
+        response = {"error": f"invalid json: {error}"}
+    else:
+        if not allow_paths and isinstance(message, dict) and "path" in message:
+            response = {"error": "bad request: paths are not accepted"}
+        else:
+            response = solve_request(message)
+    return (json.dumps(response) + "\n").encode()
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    allow_paths = True
+
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(handle_line(line, self.allow_paths))
+                self.wfile.flush()
+
+
+def preload():
+    """ Imports every solution up front """
+    for year, day in registry.days():
+        registry.solver(year, day)
+
+
+def serve(socket_path=DEFAULT_SOCKET, metrics_port=None):
+    """ Serves requests until interrupted.
+
+        Requests are solved one after the other, the solutions and
+        their caches aren't made to be used from several threads.
+        With metrics_port, the metrics of the requests are served
+        over http on that port.
+    """
+    socket_path = pathlib.Path(socket_path)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        socket_path.unlink()
+    preload()
+    if metrics_port is not None:
+        metrics.serve(metrics_port)
+    with socketserver.UnixStreamServer(str(socket_path), RequestHandler) as server:
+        print(f"Listening on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
+def request(year, day, puzzle_input=None, socket_path=DEFAULT_SOCKET):
+    """ Asks a running daemon to solve a day, returns the response.
+
+        puzzle_input is the content of the input as str, or a path.
+    """
+    message = {"year": year, "day": day}
+    if isinstance(puzzle_input, os.PathLike):
+        message["path"] = str(pathlib.Path(puzzle_input).resolve())
+    elif puzzle_input is not None:
+        message["input"] = puzzle_input
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(socket_path))
+        with connection.makefile("rwb") as stream:
+            stream.write((json.dumps(message) + "\n").encode())
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    parser.add_argument("--metrics-port", type=int,
+                        help="serve OpenMetrics over http on this port")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="start the daemon")
+    solve_parser = commands.add_parser("solve", help="ask the daemon")
+    solve_parser.add_argument("year", type=int)
+    solve_parser.add_argument("day", type=int)
+    solve_parser.add_argument("--input",
+                              help="input file to solve, - reads stdin")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == "serve":
+        serve(args.socket, args.metrics_port)
+        return
+
+    puzzle_input = None
+    if args.input == "-":
+        puzzle_input = sys.stdin.read()
+    elif args.input:
+        puzzle_input = pathlib.Path(args.input)
+    response = request(args.year, args.day, puzzle_input, args.socket)
+    if "error" in response:
+        sys.exit(response["error"])
+    print(response["answer"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+  Checks the solutions against the frozen copies in reference/.
+
+  Every day is solved by both on its real input and on a few small
+  generated inputs. The answers have to be the same, the speedup of
+  the solution over the reference is reported.
+
+  After optimizing a day, its answers stay trustworthy as long as
+    python3 -m aoc.differential 2015 9
+  passes. The exit code is 1 when any answer differs.
+"""
+import argparse
+import random
+import sys
+import time
+
+from . import generators
+from . import registry
+
+REFERENCE = "reference"
+
+# Days that get slow quickly on generated inputs.
+MAX_SIZES = {(2015, 13): 6, (2015, 15): 3}
+
+
+def timed(solver, puzzle_input):
+    """ (outcome, seconds), the outcome is the answer or the error """
+    start = time.perf_counter()
+    try:
+        outcome = ("answer", solver(puzzle_input))
+    except Exception as error:
+        outcome = ("error", type(error).__name__)
+    return outcome, time.perf_counter() - start
+
+
+def sample_inputs(year, day, samples, size, seed):
+    """ (name, puzzle_input) of the real input and the generated ones """
+    yield "real", None
+    if (year, day) not in generators.GENERATORS:
+        return
+    size = min(size, MAX_SIZES.get((year, day), size))
+    for sample in range(samples):
+        rng = random.Random(f"{seed}/{year}/{day}/{sample}")
+        yield f"generated #{sample}", generators.generate(year, day, size, rng)
+
+
+def compare_day(year, day, puzzle_inputs):
+    """ Solves every input with both, yields a row per input """
+    solver = registry.solver(year, day)
+    reference = registry.solver(year, day, REFERENCE)
+    for name, puzzle_input in puzzle_inputs:
+        expected, reference_seconds = timed(reference, puzzle_input)
+        outcome, seconds = timed(solver, puzzle_input)
+        yield {
+            "year": year,
+            "day": day,
+            "input": name,
+            "same": outcome == expected,
+            "expected": expected,
+            "outcome": outcome,
+            "reference_seconds": reference_seconds,
+            "seconds": seconds,
+        }
+
+
+def speedup(row):
+    if row["seconds"] <= 0:
+        return float("inf")
+    return row["reference_seconds"] / row["seconds"]
+
+
+def run(jobs, samples=3, size=8, seed=0, real=True):
+    """ Compares all jobs, prints a line per input, returns the rows """
+    rows = []
+    for year, day in jobs:
+        puzzle_inputs = sample_inputs(year, day, samples, size, seed)
+        if not real:
+            puzzle_inputs = (pair for pair in puzzle_inputs
+                             if pair[0] != "real")
+        for row in compare_day(year, day, puzzle_inputs):
+            status = "OK" if row["same"] else "DIFFERENT"
+            print(f"{registry.label(year, day)} {row['input']:>13}: "
+                  f"{status:9} {row['reference_seconds']:8.3f}s -> "
+                  f"{row['seconds']:8.3f}s (x{speedup(row):.1f})")
+            if not row["same"]:
+                print(f"    reference: {row['expected']}")
+                print(f"    solution:  {row['outcome']}")
+            rows.append(row)
+    return rows
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("year", type=int, nargs="?")
+    parser.add_argument("day", type=int, nargs="?")
+    parser.add_argument("--samples", type=int, default=3,
+                        help="generated inputs per day")
+    parser.add_argument("--size", type=int, default=8,
+                        help="size of the generated inputs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-real", dest="real", action="store_false",
+                        help="skip the real inputs, they can be slow")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    try:
+        jobs = registry.select(args.year, args.day)
+    except LookupError as error:
+        sys.exit(str(error))
+    rows = run(jobs, args.samples, args.size, args.seed, args.real)
+    different = [row for row in rows if not row["same"]]
+    if different:
+        print(f"{len(different)} of {len(rows)} answers differ")
+        sys.exit(1)
+    print(f"All {len(rows)} answers are the same")
+
+
+if __name__ == "__main__":
+    main()
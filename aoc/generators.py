@@ -0,0 +1,453 @@
+"""
+  Generators for synthetic puzzle inputs of any size.
+
+  Every generator takes a size and a random.Random and returns the
+  text of a valid input file for that day. What size means depends
+  on the puzzle: characters, lines, cities, grid width, ...
+
+  The inputs are random, but are built such that the solutions
+  still find an answer. (e.g. exactly one matching Sue for 2015
+  day 16, a reachable molecule for 2015 day 19)
+
+"""
+import json
+import string
+
+from . import registry
+
+GENERATORS = {}
+
+
+def generator(year, day):
+    def register(fun):
+        GENERATORS[(year, day)] = fun
+        return fun
+
+    return register
+
+
+def generate(year, day, size, rng):
+    try:
+        fun = GENERATORS[(year, day)]
+    except KeyError:
+        raise LookupError(f"No input generator for {year} day {day}") from None
+    return fun(size, rng)
+
+
+def word(rng, length, letters=string.ascii_lowercase):
+    return "".join(rng.choice(letters) for _ in range(length))
+
+
+def names(count):
+    """ count distinct capitalised names, usable as \\w+ """
+    return [f"N{idx:0{len(str(count))}d}" for idx in range(count)]
+
+
+def lines(records):
+    return "\n".join(records) + "\n"
+
+
+@generator(2015, 1)
+def brackets(size, rng):
+    return "".join(rng.choice("()") for _ in range(size))
+
+
+@generator(2015, 2)
+def boxes(size, rng):
+    return lines(
+        f"{rng.randint(1, 30)}x{rng.randint(1, 30)}x{rng.randint(1, 30)}"
+        for _ in range(size))
+
+
+@generator(2015, 3)
+def arrows(size, rng):
+    return "".join(rng.choice("^v<>") for _ in range(size))
+
+
+@generator(2015, 5)
+def naughty_or_nice(size, rng):
+    return lines(word(rng, 16) for _ in range(size))
+
+
+@generator(2015, 6)
+def light_instructions(size, rng):
+    def instruction():
+        action = rng.choice(("turn on", "turn off", "toggle"))
+        x1, x2 = sorted((rng.randrange(1000), rng.randrange(1000)))
+        y1, y2 = sorted((rng.randrange(1000), rng.randrange(1000)))
+        return f"{action} {x1},{y1} through {x2},{y2}"
+
+    return lines(instruction() for _ in range(size))
+
+
+@generator(2015, 7)
+def circuit(size, rng):
+    """ size wires, each only depending on the wires before it.
+
+        'b' is the first wire and only gets a signal, 'a' is the last.
+        The lines are shuffled, like the real input.
+    """
+    def wire_name(idx):
+        name = ""
+        idx += 1
+        while idx:
+            idx, rest = divmod(idx - 1, 26)
+            name = string.ascii_lowercase[rest] + name
+        return name
+
+    wires = ["b"] + [
+        name for name in map(wire_name, range(size + 2))
+        if name not in ("a", "b")
+    ][:max(0, size - 2)] + ["a"]
+
+    def gate(target, earlier):
+        x = rng.choice(earlier)
+        y = rng.choice(earlier)
+        kind = rng.randrange(7)
+        if kind == 0:
+            return f"{x} AND {y} -> {target}"
+        elif kind == 1:
+            return f"{x} OR {y} -> {target}"
+        elif kind == 2:
+            return f"{x} LSHIFT {rng.randint(1, 15)} -> {target}"
+        elif kind == 3:
+            return f"{x} RSHIFT {rng.randint(1, 15)} -> {target}"
+        elif kind == 4:
+            return f"NOT {x} -> {target}"
+        elif kind == 5:
+            return f"1 AND {x} -> {target}"
+        else:
+            return f"{x} -> {target}"
+
+    records = [f"{rng.randrange(1 << 16)} -> b"]
+    for idx, target in enumerate(wires[1:], start=1):
+        records.append(gate(target, wires[:idx]))
+    rng.shuffle(records)
+    return lines(records)
+
+
+@generator(2015, 8)
+def string_literals(size, rng):
+    def character():
+        kind = rng.randrange(10)
+        if kind == 0:
+            return "\\\\"
+        elif kind == 1:
+            return '\\"'
+        elif kind == 2:
+            return f"\\x{rng.randrange(256):02x}"
+        else:
+            return rng.choice(string.ascii_lowercase)
+
+    return lines('"' + "".join(character() for _ in range(rng.randint(0, 30)))
+                 + '"' for _ in range(size))
+
+
+@generator(2015, 9)
+def city_graph(size, rng):
+    cities = names(size)
+    return lines(f"{src} to {dst} = {rng.randint(10, 200)}"
+                 for idx, src in enumerate(cities) for dst in cities[idx + 1:])
+
+
+@generator(2015, 12)
+def accounting_json(size, rng):
+    """ A nested document with about size values """
+    remaining = [size]
+
+    def value(depth):
+        remaining[0] -= 1
+        kind = rng.randrange(6)
+        if depth < 10 and remaining[0] > 0 and kind == 0:
+            return [value(depth + 1) for _ in range(rng.randint(1, 8))]
+        elif depth < 10 and remaining[0] > 0 and kind == 1:
+            return {
+                rng.choice(string.ascii_lowercase): value(depth + 1)
+                for _ in range(rng.randint(1, 8))
+            }
+        elif kind == 2:
+            return rng.choice(("red", "green", "blue", "orange"))
+        return rng.randint(-50, 200)
+
+    document = []
+    while remaining[0] > 0:
+        document.append(value(0))
+    return json.dumps(document, separators=(",", ":"))
+
+
+@generator(2015, 13)
+def seating(size, rng):
+    people = names(size)
+    records = []
+    for person in people:
+        for neighbour in people:
+            if person != neighbour:
+                change = rng.choice(("gain", "lose"))
+                records.append(
+                    f"{person} would {change} {rng.randint(1, 100)} happiness "
+                    f"units by sitting next to {neighbour}.")
+    return lines(records)
+
+
+@generator(2015, 14)
+def reindeers(size, rng):
+    return lines(f"{name} can fly {rng.randint(5, 30)} km/s for "
+                 f"{rng.randint(2, 20)} seconds, but then must rest for "
+                 f"{rng.randint(20, 200)} seconds." for name in names(size))
+
+
+@generator(2015, 15)
+def ingredients(size, rng):
+    def prop():
+        return rng.randint(-5, 5)
+
+    return lines(f"{name}: capacity {prop()}, durability {prop()}, "
+                 f"flavor {prop()}, texture {prop()}, "
+                 f"calories {rng.randint(1, 9)}" for name in names(size))
+
+
+@generator(2015, 16)
+def aunts(size, rng):
+    """ size Sues, exactly one matches exactly and one matches fuzzy """
+    exact_only = {"children", "samoyeds", "akitas", "vizslas", "cars",
+                  "perfumes"}
+    target = {"children": 3, "cats": 7, "samoyeds": 2, "pomeranians": 3,
+              "akitas": 0, "vizslas": 0, "goldfish": 5, "trees": 3,
+              "cars": 2, "perfumes": 1}
+
+    def mismatch(key):
+        """ A value failing both the exact and the fuzzy compare """
+        if key in exact_only:
+            return rng.choice([v for v in range(11) if v != target[key]])
+        elif key in ("cats", "trees"):
+            return rng.randrange(target[key])
+        else:
+            return rng.randint(target[key] + 1, 10)
+
+    def describe(things):
+        return ", ".join(f"{key}: {count}" for key, count in things.items())
+
+    sues = []
+    for _ in range(max(0, size - 2)):
+        keys = rng.sample(sorted(target), 3)
+        things = {key: rng.randint(0, 10) for key in keys[1:]}
+        things[keys[0]] = mismatch(keys[0])
+        sues.append(describe(things))
+    sues.insert(rng.randint(0, len(sues)),
+                describe({"cats": 7, "children": 3, "cars": 2}))
+    sues.insert(rng.randint(0, len(sues)),
+                describe({"cats": 8, "trees": 4, "goldfish": 2}))
+    return lines(f"Sue {idx}: {sue}" for idx, sue in enumerate(sues, 1))
+
+
+@generator(2015, 17)
+def containers(size, rng):
+    """ size containers, some of them adding up to 150 """
+    sizes = []
+    remaining = 150
+    while remaining > 50:
+        sizes.append(rng.randint(5, 50))
+        remaining -= sizes[-1]
+    sizes.append(remaining)
+    while len(sizes) < size:
+        sizes.append(rng.randint(5, 50))
+    rng.shuffle(sizes)
+    return lines(map(str, sizes))
+
+
+@generator(2015, 18)
+def light_grid(size, rng):
+    """ Always 100 by 100, the frozen copy only knows that size """
+    return lines(
+        "".join(rng.choice("#.") for _ in range(100)) for _ in range(100))
+
+
+@generator(2015, 19)
+def molecule(size, rng):
+    """ The real replacements, with a molecule made in size steps from e """
+    path = registry.ROOT.joinpath("year2015", "day_19.txt")
+    replacements = [line.split(" => ") for line in path.read_text().splitlines()
+                    if "=>" in line]
+    molecule = "e"
+    for _ in range(size):
+        # e only starts the molecule, it can't be replaced halfway.
+        options = [(start, end) for start, end in replacements
+                   if start in molecule and (start != "e" or molecule == "e")]
+        if not options:
+            break
+        start, end = rng.choice(options)
+        positions = [idx for idx in range(len(molecule))
+                     if molecule.startswith(start, idx)]
+        idx = rng.choice(positions)
+        molecule = molecule[:idx] + end + molecule[idx + len(start):]
+    return lines([f"{start} => {end}" for start, end in replacements]
+                 + ["", molecule])
+
+
+@generator(2015, 23)
+def collatz_program(size, rng):
+    """ The same program as the real input, with size setup steps per part """
+    def setup():
+        return [rng.choice(("inc a", "tpl a")) for _ in range(size)]
+
+    first = ["inc a"] + setup()
+    second = ["inc a"] + setup()
+    program = ([f"jio a, +{len(first) + 2}"] + first
+               + [f"jmp +{len(second) + 1}"] + second + [
+                   "jio a, +8", "inc b", "jie a, +4", "tpl a", "inc a",
+                   "jmp +2", "hlf a", "jmp -7"
+               ])
+    return lines(program)
+
+
+@generator(2015, 24)
+def package_weights(size, rng):
+    """ 12 groups of the same weight, so both 3 and 4 groups exist """
+    per_group = max(2, size // 12)
+    target = 20 * per_group
+    weights = []
+    for _ in range(12):
+        group = [rng.randint(1, 2 * target // per_group - 1)
+                 for _ in range(per_group - 1)]
+        while sum(group) >= target:
+            group = [max(1, weight // 2) for weight in group]
+        weights.extend(group + [target - sum(group)])
+    return lines(map(str, sorted(weights)))
+
+
+@generator(2016, 1)
+def taxicab_directions(size, rng):
+    return ", ".join(f"{rng.choice('LR')}{rng.randint(1, 200)}"
+                     for _ in range(size))
+
+
+@generator(2016, 2)
+def keypad_moves(size, rng):
+    return lines(
+        "".join(rng.choice("UDLR") for _ in range(max(1, size // 5)))
+        for _ in range(5))
+
+
+@generator(2016, 3)
+def triangles(size, rng):
+    return lines("".join(f"{rng.randint(1, 999):5d}" for _ in range(3))
+                 for _ in range(3 * max(1, size // 3)))
+
+
+@generator(2016, 4)
+def rooms(size, rng):
+    """ Rooms with half of them a correct checksum """
+    def checksum(letters):
+        counts = {}
+        for letter in letters:
+            counts[letter] = counts.get(letter, 0) + 1
+        ordered = sorted(counts.items(), key=lambda r: (-r[1], r[0]))
+        return "".join(letter for letter, _ in ordered[:5])
+
+    records = []
+    for _ in range(size):
+        parts = [word(rng, rng.randint(2, 10)) for _ in range(rng.randint(2, 5))]
+        real = checksum("".join(parts))
+        code = real if rng.random() < 0.5 else word(rng, 5)
+        records.append(f"{'-'.join(parts)}-{rng.randint(100, 999)}[{code}]")
+    return lines(records)
+
+
+@generator(2016, 6)
+def noisy_messages(size, rng):
+    return lines(word(rng, 8) for _ in range(size))
+
+
+@generator(2016, 7)
+def ip_addresses(size, rng):
+    def address():
+        parts = [word(rng, rng.randint(3, 16), "abcdef")]
+        for _ in range(rng.randint(0, 3)):
+            parts.append(f"[{word(rng, rng.randint(3, 16), 'abcdef')}]")
+            parts.append(word(rng, rng.randint(3, 16), "abcdef"))
+        return "".join(parts)
+
+    return lines(address() for _ in range(size))
+
+
+@generator(2016, 8)
+def lcd_instructions(size, rng):
+    def instruction():
+        kind = rng.randrange(3)
+        if kind == 0:
+            return f"rect {rng.randint(1, 50)}x{rng.randint(1, 6)}"
+        elif kind == 1:
+            return f"rotate row y={rng.randrange(6)} by {rng.randint(1, 49)}"
+        else:
+            return f"rotate column x={rng.randrange(50)} by {rng.randint(1, 5)}"
+
+    return lines(instruction() for _ in range(size))
+
+
+@generator(2016, 9)
+def compressed_text(size, rng):
+    """ About size characters of text with (nested) markers """
+    def segment(budget, depth):
+        parts = []
+        length = 0
+        while length < budget:
+            if depth < 4 and rng.random() < 0.3:
+                inner = segment(rng.randint(1, max(1, (budget - length) // 2)),
+                                depth + 1)
+                part = f"({len(inner)}x{rng.randint(2, 15)}){inner}"
+            else:
+                part = word(rng, rng.randint(1, 10), string.ascii_uppercase)
+            parts.append(part)
+            length += len(part)
+        return "".join(parts)
+
+    return segment(size, 0) + "\n"
+
+
+@generator(2016, 10)
+def bot_network(size, rng):
+    """ size bots, each ending up with exactly two chips """
+    leaves = max(1, size // 4)
+    values = rng.sample(range(1, 10 * size + 100), 2 * leaves)
+    records = []
+    pending = []
+    for bot in range(max(size, leaves)):
+        if bot < leaves:
+            for value in values[2 * bot:2 * bot + 2]:
+                records.append(f"value {value} goes to bot {bot}")
+        else:
+            for _ in range(2):
+                giver, which = pending.pop(rng.randrange(len(pending)))
+                giver[which] = f"bot {bot}"
+        bot_outputs = {}
+        pending.append((bot_outputs, "low"))
+        pending.append((bot_outputs, "high"))
+        records.append((bot, bot_outputs))
+
+    for output, (giver, which) in enumerate(pending):
+        giver[which] = f"output {output}"
+
+    def as_line(record):
+        if isinstance(record, str):
+            return record
+        bot, outputs = record
+        return (f"bot {bot} gives low to {outputs['low']} "
+                f"and high to {outputs['high']}")
+
+    result = [as_line(record) for record in records]
+    rng.shuffle(result)
+    return lines(result)
+
+
+@generator(2016, 12)
+def assembunny_program(size, rng):
+    """ size loops, each adding a number to register a """
+    program = []
+    for _ in range(size):
+        program.extend([
+            f"cpy {rng.randint(1, 1000)} b",
+            "inc a",
+            "dec b",
+            "jnz b -2",
+        ])
+    return lines(program)
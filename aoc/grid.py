@@ -0,0 +1,79 @@
+"""
+  Grids of lights backed by numpy arrays.
+
+  Used by 2015 day 6 and 18 and 2016 day 8. Instead of looping over
+  every cell in python, whole rectangles, rows and columns are
+  updated at once.
+
+  A grid is a plain 2d numpy array, indexed as grid[y, x].
+  Rectangles are given by two corners (x, y), both included.
+
+"""
+import numpy as np
+
+
+def new(width, height, dtype=bool):
+    return np.zeros((height, width), dtype=dtype)
+
+
+def from_lines(lines, on="#"):
+    """ A bool grid, True where the character is on """
+    rows = [[ch == on for ch in line] for line in lines if line]
+    return np.array(rows, dtype=bool)
+
+
+def as_text(grid, on="#", off="."):
+    return "".join("".join(on if cell else off for cell in row) + "\n"
+                   for row in grid)
+
+
+def _rectangle(grid, start, end):
+    (start_x, start_y), (end_x, end_y) = start, end
+    return grid[start_y:end_y + 1, start_x:end_x + 1]
+
+
+def assign(grid, start, end, value):
+    _rectangle(grid, start, end)[...] = value
+
+
+def toggle(grid, start, end):
+    rectangle = _rectangle(grid, start, end)
+    np.logical_not(rectangle, out=rectangle)
+
+
+def add(grid, start, end, amount, minimum=None):
+    """ Adds amount to the rectangle, never going below minimum """
+    rectangle = _rectangle(grid, start, end)
+    rectangle += amount
+    if minimum is not None:
+        np.maximum(rectangle, minimum, out=rectangle)
+
+
+def neighbour_count(grid):
+    """ For every cell, the number of its 8 neighbours that are on.
+
+        A 3x3 convolution done as the sum of 8 shifted views on a
+        padded copy. Cells outside the grid count as off.
+    """
+    height, width = grid.shape
+    padded = np.pad(grid.astype(np.uint8), 1)
+    counts = np.zeros((height, width), dtype=np.uint8)
+    for dy in range(3):
+        for dx in range(3):
+            if dy != 1 or dx != 1:
+                counts += padded[dy:dy + height, dx:dx + width]
+    return counts
+
+
+def life_step(grid):
+    """ Game of life: on with 3 neighbours, stays on with 2 """
+    counts = neighbour_count(grid)
+    return (counts == 3) | (grid & (counts == 2))
+
+
+def roll_row(grid, y, amount):
+    grid[y, :] = np.roll(grid[y, :], amount)
+
+
+def roll_column(grid, x, amount):
+    grid[:, x] = np.roll(grid[:, x], amount)
@@ -0,0 +1,185 @@
+"""
+  Reading the puzzle inputs.
+
+  A puzzle input can be given in several ways:
+    - a path (pathlib.Path or any other os.PathLike)
+    - the content itself, as str or bytes
+    - an open file, like sys.stdin, which is consumed while solving
+
+  Files are read only once per process, as bytes. Large files are
+  mapped in memory instead of copied. The text, the lines and the
+  parsed form of a file are all remembered, so solving a day twice
+  (or both parts separately) doesn't read or parse again. A file that
+  changes on disk is read again. Content given directly and open
+  files aren't remembered.
+
+  What is remembered is bounded (memo.lru), the files not used for
+  the longest time are forgotten first. A daemon solving many files
+  doesn't keep them all.
+
+  While redirected, inputs are read from another directory instead.
+  That's how the synthetic inputs are fed to the solutions.
+
+"""
+import contextlib
+import io
+import mmap
+import os
+import pathlib
+
+from . import memo
+
+MMAP_THRESHOLD = 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+MAX_FILES = 64
+MAX_BYTES = 256 * 1024 * 1024
+
+_raw = memo.lru("inputs raw", max_entries=MAX_FILES, max_bytes=MAX_BYTES,
+                size=lambda key, data: data.nbytes)
+# A few derived forms per file: text, lines, parsed.
+_derived = memo.lru("inputs derived", max_entries=4 * MAX_FILES,
+                    max_bytes=MAX_BYTES)
+_redirects = []
+_missing = object()
+
+
+@contextlib.contextmanager
+def redirected(directory):
+    """ Reads inputs from directory when it has a file with the same name """
+    _redirects.append(pathlib.Path(directory))
+    try:
+        yield
+    finally:
+        _redirects.pop()
+
+
+def source(puzzle_input, default_path):
+    """ The input to use: the given one, or the file of the day """
+    return default_path if puzzle_input is None else puzzle_input
+
+
+def _is_path(puzzle_input):
+    return isinstance(puzzle_input, os.PathLike)
+
+
+def _is_stream(puzzle_input):
+    return hasattr(puzzle_input, "read")
+
+
+def _identity(path):
+    path = pathlib.Path(path)
+    for directory in reversed(_redirects):
+        if (candidate := directory.joinpath(path.name)).exists():
+            path = candidate
+            break
+    path = path.resolve()
+    stat = path.stat()
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _read_stream(stream):
+    data = stream.read()
+    return data.encode() if isinstance(data, str) else data
+
+
+def read_bytes(puzzle_input):
+    """ The whole input as a read-only memoryview """
+    if _is_stream(puzzle_input):
+        return memoryview(_read_stream(puzzle_input))
+    elif not _is_path(puzzle_input):
+        if isinstance(puzzle_input, str):
+            puzzle_input = puzzle_input.encode()
+        return memoryview(puzzle_input)
+
+    identity = _identity(puzzle_input)
+    data = _raw.get(identity)
+    if data is None:
+        real_path, _, size = identity
+        with open(real_path, "rb") as f:
+            if size >= MMAP_THRESHOLD:
+                # The map outlives the file object, mmap keeps its own handle.
+                data = memoryview(
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                data = memoryview(f.read())
+        _raw.put(identity, data)
+    return data
+
+
+def _remember(puzzle_input, key, make):
+    if not _is_path(puzzle_input):
+        return make()
+    identity = (_identity(puzzle_input), key)
+    # Missing is told apart from a remembered None.
+    value = _derived.get(identity, _missing)
+    if value is _missing:
+        value = make()
+        _derived.put(identity, value)
+    return value
+
+
+def read_text(puzzle_input):
+    """ The whole input as str """
+    if isinstance(puzzle_input, str):
+        return puzzle_input
+    return _remember(puzzle_input, "text",
+                     lambda: str(read_bytes(puzzle_input), "utf8"))
+
+
+def lines(puzzle_input):
+    """ All lines of the input, without their line endings """
+    return _remember(puzzle_input, "lines",
+                     lambda: tuple(read_text(puzzle_input).splitlines()))
+
+
+def iter_lines(puzzle_input):
+    """ The lines of the input, without line endings.
+
+        Open files are consumed a line at a time, so the input never
+        has to fit in memory at once.
+    """
+    if not _is_stream(puzzle_input):
+        yield from lines(puzzle_input)
+        return
+
+    stream = puzzle_input
+    if not isinstance(stream, io.TextIOBase):
+        stream = io.TextIOWrapper(stream, encoding="utf8")
+    for line in stream:
+        yield line.rstrip("\r\n")
+
+
+def iter_chunks(puzzle_input, chunk_size=CHUNK_SIZE):
+    """ The input as consecutive pieces of bytes.
+
+        Files and content are given in one piece, open files are read
+        chunk_size bytes at a time.
+    """
+    if not _is_stream(puzzle_input):
+        yield read_bytes(puzzle_input)
+        return
+
+    stream = getattr(puzzle_input, "buffer", puzzle_input)
+    while chunk := stream.read(chunk_size):
+        yield chunk.encode() if isinstance(chunk, str) else chunk
+
+
+def parsed(puzzle_input, parser, key=None):
+    """ The result of parser(text), parsing a file only once per process.
+
+        The parser is recognised on its (qualified) name, so the inner
+        functions of a solve_day_* can be used as well. Otherwise key
+        tells the parsers apart. The result is shared, it shouldn't be
+        modified.
+    """
+    if key is None:
+        key = (parser.__module__, parser.__qualname__)
+    key = ("parsed", key)
+    return _remember(puzzle_input, key,
+                     lambda: parser(read_text(puzzle_input)))
+
+
+def clear():
+    """ Forgets everything that was read """
+    _derived.clear()
+    _raw.clear()
@@ -0,0 +1,107 @@
+"""
+  Mining md5 hashes with leading zeros (2015 day 4, 2016 day 5).
+
+  Hashes md5(salt + str(counter)) for counter = start, start + 1, ...
+  and reports the counters whose hash starts with enough zeros.
+
+  The counters are split in batches handed out to a process pool.
+  Results still come back in counter order, so "the first N hits"
+  stays the same as mining one hash at a time. Within a batch the
+  md5 state after the salt is reused (hashlib's copy()), and the
+  zeros are checked on the raw digest instead of its hex string.
+
+"""
+import collections
+import concurrent.futures
+import hashlib
+import itertools
+import os
+
+from . import progress
+
+BATCH_SIZE = 50000
+
+_workers = None
+
+
+def set_workers(workers):
+    """ The workers mine() uses when it isn't told, None for all cores.
+
+        The runners call it in the processes they start, with the
+        share of the cores of one of the days running at once.
+    """
+    global _workers
+    _workers = workers
+
+
+def share(parallel):
+    """ Workers for each of parallel days mining at the same time """
+    return max(1, (os.cpu_count() or 1) // parallel)
+
+
+def has_leading_zeros(digest, zeros):
+    """ True when the hex form of digest starts with zeros '0' characters """
+    full_bytes, half_byte = divmod(zeros, 2)
+    if digest[:full_bytes].count(0) != full_bytes:
+        return False
+    return not half_byte or digest[full_bytes] < 16
+
+
+def mine_batch(salt, start, stop, zeros):
+    """ All (counter, digest) in [start, stop) with enough leading zeros """
+    base = hashlib.md5(salt, usedforsecurity=False)
+    full_bytes, half_byte = divmod(zeros, 2)
+    prefix = bytes(full_bytes)
+    found = []
+    for counter in range(start, stop):
+        current = base.copy()
+        current.update(b"%d" % counter)
+        digest = current.digest()
+        if digest.startswith(prefix) and (not half_byte
+                                          or digest[full_bytes] < 16):
+            found.append((counter, digest))
+    return found
+
+
+def _batches(start, batch_size):
+    for batch_start in itertools.count(start, batch_size):
+        yield batch_start, batch_start + batch_size
+
+
+def mine(salt, zeros, start=0, workers=None, batch_size=BATCH_SIZE):
+    """ Yields (counter, digest) with at least zeros leading hex zeros.
+
+        Never stops by itself, the caller stops iterating when it has
+        seen enough. workers defaults to what set_workers said, or the
+        number of cores. With a single worker everything is mined in
+        the current process.
+        The hashes are counted in a progress tracker.
+    """
+    if workers is None:
+        workers = _workers or os.cpu_count() or 1
+
+    label = f"md5 mining {salt.decode(errors='replace')}"
+    with progress.tracking(label) as step:
+        if workers <= 1:
+            for batch_start, batch_stop in _batches(start, batch_size):
+                yield from mine_batch(salt, batch_start, batch_stop, zeros)
+                step(batch_size)
+            return
+
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        try:
+            # Keeping a few batches per worker in flight, results are
+            # taken in order from the front.
+            batches = _batches(start, batch_size)
+            in_flight = collections.deque()
+            while True:
+                while len(in_flight) < 2 * workers:
+                    batch_start, batch_stop = next(batches)
+                    in_flight.append(
+                        pool.submit(mine_batch, salt, batch_start,
+                                    batch_stop, zeros))
+                yield from in_flight.popleft().result()
+                step(batch_size)
+        finally:
+            # Waiting, workers left behind block the exit of the process.
+            pool.shutdown(wait=True, cancel_futures=True)
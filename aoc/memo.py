@@ -0,0 +1,125 @@
+"""
+  Bounded memos for the days that remember results between calls.
+
+  A memo keeps at most max_entries entries and max_bytes bytes, the
+  least recently used entries are evicted first. Unlike clearing a
+  dict when it gets big, the entries in use stay.
+
+  Every memo counts its hits, misses and evictions, to see whether
+  its bounds fit. The memos are created by name with lru(), stats()
+  has the counts of all of them and the metrics export them:
+    aoc_memo_hits_total{memo="2016/9 expansions"} 8127
+
+"""
+import collections
+import itertools
+import sys
+import threading
+
+Stats = collections.namedtuple("Stats",
+                               "hits misses evictions entries bytes")
+
+_lock = threading.Lock()
+_memos = {}
+
+
+def _sizeof(value):
+    """ Rough size in bytes, including the contents of containers """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        value = itertools.chain.from_iterable(value.items())
+    elif not isinstance(value, (tuple, list, set, frozenset)):
+        return size
+    return size + sum(_sizeof(item) for item in value)
+
+
+def _size(key, value):
+    return _sizeof(key) + _sizeof(value)
+
+
+class LRU(object):
+    """ A mapping evicting the least recently used entries first.
+
+        max_entries or max_bytes of None is unbounded. size(key, value)
+        tells the bytes an entry counts for, it is taken when the entry
+        is put. Values shouldn't be changed once they are put, put a
+        new value instead. Safe to share between threads.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, size=_size):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._size = size
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        nbytes = self._size(key, value)
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, nbytes)
+            self.bytes += nbytes
+            self._evict()
+
+    def _evict(self):
+        # Called with the lock held.
+        while self._entries and (
+                (self.max_entries is not None
+                 and len(self._entries) > self.max_entries) or
+                (self.max_bytes is not None and self.bytes > self.max_bytes)):
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.bytes -= nbytes
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return Stats(self.hits, self.misses, self.evictions,
+                         len(self._entries), self.bytes)
+
+
+def lru(name, max_entries=None, max_bytes=None, size=_size):
+    """ A new LRU, reported under name """
+    memo = LRU(max_entries, max_bytes, size)
+    with _lock:
+        _memos[name] = memo
+    return memo
+
+
+def stats():
+    """ name -> Stats of every memo """
+    with _lock:
+        memos = sorted(_memos.items())
+    return {name: memo.stats() for name, memo in memos}
+
+
+def clear():
+    """ Empties every memo, the counts are kept """
+    with _lock:
+        memos = list(_memos.values())
+    for memo in memos:
+        memo.clear()
@@ -0,0 +1,180 @@
+"""
+  Timings and resource usage of the solve_day_* calls, for dashboards.
+
+  Every call records its wall time, cpu time, the peak RSS of the
+  process and the answer. The latest call per day, and totals over
+  all calls, are exported in the OpenMetrics text format:
+    aoc_solve_wall_seconds{year="2016",day="11"} 2.91
+  Either written to a file after a run, or served over http while the
+  daemon or a long run is busy:
+    python3 solutions.py --jobs --metrics metrics.txt
+    python3 solutions.py --metrics-port 9100
+    python3 -m aoc.daemon --metrics-port 9100 serve
+  The hits, misses and size of the memos (see memo.py) are included.
+"""
+import collections
+import http.server
+import os
+import pathlib
+import resource
+import sys
+import threading
+import time
+
+from . import memo
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+Call = collections.namedtuple("Call", "year day result wall cpu max_rss")
+
+_lock = threading.Lock()
+_latest = {}
+_totals = collections.defaultdict(lambda: [0, 0.0, 0.0])
+
+
+def rss_bytes(usage):
+    """ The ru_maxrss of a resource usage, in bytes """
+    # Linux reports kilobytes, macOS bytes.
+    if sys.platform == "darwin":
+        return usage.ru_maxrss
+    return usage.ru_maxrss * 1024
+
+
+def max_rss():
+    """ Peak resident memory of this process so far, in bytes """
+    return rss_bytes(resource.getrusage(resource.RUSAGE_SELF))
+
+
+def measure(year, day, solve):
+    """ Calls solve, returns the Call with its answer and usage """
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    result = solve()
+    wall = time.perf_counter() - start_wall
+    cpu = time.process_time() - start_cpu
+    return Call(year, day, result, wall, cpu, max_rss())
+
+
+def record(call):
+    with _lock:
+        _latest[(call.year, call.day)] = call
+        totals = _totals[(call.year, call.day)]
+        totals[0] += 1
+        totals[1] += call.wall
+        totals[2] += call.cpu
+
+
+def clear():
+    with _lock:
+        _latest.clear()
+        _totals.clear()
+
+
+def _escape(value):
+    return (str(value).replace("\\", "\\\\").replace('"', '\\"')
+            .replace("\n", "\\n"))
+
+
+def _labels(year, day, **extra):
+    labels = {"year": year, "day": day, **extra}
+    return ",".join(f'{name}="{_escape(value)}"'
+                    for name, value in labels.items())
+
+
+def render():
+    """ All recorded calls in the OpenMetrics text format """
+    with _lock:
+        latest = sorted(_latest.items())
+        totals = sorted((key, list(value)) for key, value in _totals.items())
+
+    families = [
+        ("aoc_solve_wall_seconds", "gauge", "Wall time of the last solve",
+         lambda call: call.wall),
+        ("aoc_solve_cpu_seconds", "gauge", "CPU time of the last solve",
+         lambda call: call.cpu),
+        ("aoc_solve_max_rss_bytes", "gauge",
+         "Peak RSS of the solving process after the last solve",
+         lambda call: call.max_rss),
+    ]
+    lines = []
+    for name, kind, help_text, value in families:
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"# HELP {name} {help_text}.")
+        for (year, day), call in latest:
+            lines.append(f"{name}{{{_labels(year, day)}}} {value(call)}")
+
+    lines.append("# TYPE aoc_solve_result info")
+    lines.append("# HELP aoc_solve_result Answer of the last solve.")
+    for (year, day), call in latest:
+        labels = _labels(year, day, result=call.result)
+        lines.append(f"aoc_solve_result_info{{{labels}}} 1")
+
+    counters = [
+        ("aoc_solve_calls", "Number of solves", 0),
+        ("aoc_solve_wall_time_seconds", "Wall time of all solves", 1),
+        ("aoc_solve_cpu_time_seconds", "CPU time of all solves", 2),
+    ]
+    for name, help_text, idx in counters:
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f"# HELP {name} {help_text}.")
+        for (year, day), total in totals:
+            lines.append(f"{name}_total{{{_labels(year, day)}}} {total[idx]}")
+
+    memos = memo.stats().items()
+    memo_families = [
+        ("aoc_memo_hits", "counter", "Lookups found in the memo", "hits"),
+        ("aoc_memo_misses", "counter", "Lookups not found in the memo",
+         "misses"),
+        ("aoc_memo_evictions", "counter", "Entries evicted from the memo",
+         "evictions"),
+        ("aoc_memo_entries", "gauge", "Entries in the memo", "entries"),
+        ("aoc_memo_bytes", "gauge", "Estimated size of the memo", "bytes"),
+    ]
+    for name, kind, help_text, field in memo_families:
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"# HELP {name} {help_text}.")
+        suffix = "_total" if kind == "counter" else ""
+        for memo_name, stats in memos:
+            lines.append(f'{name}{suffix}{{memo="{_escape(memo_name)}"}} '
+                         f"{getattr(stats, field)}")
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def write(path):
+    """ Writes the metrics to path, e.g. for node_exporter's textfile """
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{os.getpid()}")
+    temporary.write_text(render())
+    os.replace(temporary, path)
+
+
+class MetricsHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port, host="127.0.0.1"):
+    """ Serves /metrics from a background thread, returns the server.
+
+        The thread doesn't keep the process alive, call shutdown() on
+        the server to stop earlier.
+    """
+    server = http.server.ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
@@ -0,0 +1,85 @@
+"""
+  Parsing a whole input with a single compiled pattern.
+
+  A grammar is the pattern of one record, a line, and a converter per
+  group of the pattern (e.g. int, or None to keep the str). Every line
+  is matched with that one compiled pattern, instead of trying several
+  patterns per line. Blank lines are skipped, any other line that
+  doesn't match raises a ValueError.
+
+  The grammars are made once, at import, and a file is parsed only
+  once per process:
+    _routes = parsing.grammar(r"^(\w+) to (\w+) = (\d+)", None, None, int)
+    for source, target, distance in parsing.records(puzzle_input, _routes):
+        ...
+"""
+import collections
+import re
+
+from . import artifacts
+from . import inputs
+
+Grammar = collections.namedtuple("Grammar", "pattern converters")
+
+
+def grammar(pattern, *converters, flags=re.MULTILINE):
+    """ A compiled pattern with a converter per group """
+    compiled = re.compile(pattern, flags)
+    if compiled.groups != len(converters):
+        raise ValueError(f"{pattern} has {compiled.groups} groups, "
+                         f"but {len(converters)} converters")
+    return Grammar(compiled, converters)
+
+
+def parse(grammar, text):
+    """ All records in text, as tuples of converted fields.
+
+        Groups that didn't take part in the match stay None.
+    """
+    pattern, converters = grammar
+
+    def matches():
+        for number, line in enumerate(text.splitlines(), 1):
+            if not line.strip():
+                continue
+            matched = pattern.match(line)
+            if matched is None:
+                raise ValueError(f"line {number} doesn't match "
+                                 f"{pattern.pattern}: {line!r}")
+            yield matched.groups()
+
+    if not any(converters):
+        return tuple(matches())
+
+    def convert(groups):
+        return tuple(
+            value if value is None or converter is None else converter(value)
+            for converter, value in zip(converters, groups))
+
+    return tuple(convert(groups) for groups in matches())
+
+
+def _name(grammar):
+    """ Stays the same between runs, unlike the grammar itself """
+    converters = ",".join(
+        "" if converter is None else
+        f"{converter.__module__}.{converter.__qualname__}"
+        for converter in grammar.converters)
+    return f"records:{grammar.pattern.pattern}:{converters}"
+
+
+def records(puzzle_input, grammar, persist=False):
+    """ parse on the whole input, parsing a file only once.
+
+        With persist, the records are also kept on disk for later runs
+        (see artifacts). All converters should give plain data then.
+    """
+    if persist:
+        # The lambda is the same whatever it calls, parse and the
+        # converters are in the name.
+        code = artifacts.code_digest(parse, *grammar.converters)
+        return artifacts.parsed(puzzle_input,
+                                lambda text: parse(grammar, text),
+                                name=f"{_name(grammar)}:{code}")
+    return inputs.parsed(puzzle_input, lambda text: parse(grammar, text),
+                         key=("records", grammar))
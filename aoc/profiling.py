@@ -0,0 +1,110 @@
+"""
+  Profiling a single day without touching its source.
+
+  cProfile writes a .pstats file per day, to be explored with
+  pstats or snakeviz. tracemalloc reports the source lines that
+  allocated most of the memory, at the moment the traced memory
+  was the highest.
+
+"""
+import cProfile
+import pathlib
+import threading
+import tracemalloc
+
+from . import registry
+
+
+class PeakSnapshots(threading.Thread):
+    """ Takes tracemalloc snapshots every interval, keeping the largest.
+
+        Most memory of a solution is freed again once it returns,
+        a snapshot at the end would miss it.
+    """
+
+    def __init__(self, interval=0.1):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.largest = 0
+        self.snapshot = None
+
+    def capture(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if self.snapshot is None or current > self.largest:
+            self.largest = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.capture()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.capture()
+
+
+def allocation_report(snapshot, peak, top):
+    # Leave out the memory of the snapshotting thread itself.
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, tracemalloc.__file__),
+    ))
+    statistics = snapshot.statistics("lineno")
+    lines = [f"Peak traced memory: {peak / 1024:.1f} KiB",
+             f"Top {top} allocation sites near the peak:"]
+    for stat in statistics[:top]:
+        frame = stat.traceback[0]
+        lines.append(f"  {stat.size / 1024:10.1f} KiB {stat.count:8} blocks"
+                     f"  {frame.filename}:{frame.lineno}")
+    return "\n".join(lines) + "\n"
+
+
+def profile_day(year, day, directory, cpu=True, memory=True, top=10):
+    """ Solves the day under cProfile and/or tracemalloc.
+
+        Returns the answer and the paths of the written reports.
+    """
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    name = f"{year}_day_{day}"
+    solver = registry.solver(year, day)
+    reports = []
+
+    if memory:
+        tracemalloc.start()
+        snapshots = PeakSnapshots()
+        snapshots.start()
+    profiler = cProfile.Profile() if cpu else None
+    try:
+        if profiler:
+            profiler.enable()
+        result = solver()
+    finally:
+        if profiler:
+            profiler.disable()
+        if memory:
+            snapshots.stop()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    if profiler:
+        pstats_path = directory.joinpath(f"{name}.pstats")
+        profiler.dump_stats(pstats_path)
+        reports.append(pstats_path)
+    if memory:
+        report_path = directory.joinpath(f"{name}_allocations.txt")
+        report_path.write_text(
+            allocation_report(snapshots.snapshot, peak, top))
+        reports.append(report_path)
+    return result, reports
+
+
+def profile(jobs, directory, cpu=True, memory=True, top=10):
+    """ Profiles every job, printing the answers and where the reports went """
+    for year, day in jobs:
+        result, reports = profile_day(year, day, directory, cpu, memory, top)
+        print(f"{registry.label(year, day)}: {result}")
+        for path in reports:
+            print(f"  {path}")
@@ -0,0 +1,97 @@
+"""
+  Reports how fast the long loops are going.
+
+  A loop counts its work in a tracker:
+    with progress.tracking("2015/20 houses", total=bound) as step:
+        for house in houses:
+            step()
+  Once enabled, every interval seconds the count, the rate and, when
+  the total is known, an estimate of the time left are reported. By
+  default as a line on stderr, or to a callback taking a Progress.
+
+  Disabled, which is the default, step is a function doing nothing,
+  so the loops pay for little more than the call. Enable it before a
+  pool is started, the workers inherit it.
+
+"""
+import collections
+import contextlib
+import sys
+import time
+
+Progress = collections.namedtuple("Progress",
+                                  "label count elapsed rate total eta done")
+
+INTERVAL = 1.0
+
+_callback = None
+_interval = INTERVAL
+
+
+def enable(callback=None, interval=INTERVAL):
+    """ Reports to callback, or to stderr when callback is None """
+    global _callback, _interval
+    _callback = callback or print_line
+    _interval = interval
+
+
+def disable():
+    global _callback
+    _callback = None
+
+
+def as_line(report):
+    line = (f"{report.label}: {report.count} in {report.elapsed:.1f}s, "
+            f"{report.rate:.0f}/s")
+    if report.eta is not None:
+        line += f", {report.count / report.total:.0%} of {report.total}"
+        line += f", ETA {report.eta:.0f}s"
+    if report.done:
+        line += ", done"
+    return line
+
+
+def print_line(report):
+    print(as_line(report), file=sys.stderr, flush=True)
+
+
+def _ignore(count=1):
+    pass
+
+
+def _report(label, count, start, total, done):
+    elapsed = time.monotonic() - start
+    rate = count / elapsed if elapsed > 0 else 0.0
+    eta = None
+    if total and rate > 0:
+        eta = max(0.0, (total - count) / rate)
+    return Progress(label, count, elapsed, rate, total, eta, done)
+
+
+@contextlib.contextmanager
+def tracking(label, total=None):
+    """ Gives a step(count=1) counting work done towards total.
+
+        total is an upper bound on the count, when there is one.
+    """
+    callback = _callback
+    if callback is None:
+        yield _ignore
+        return
+
+    start = time.monotonic()
+    next_report = start + _interval
+    count = 0
+
+    def step(amount=1):
+        nonlocal count, next_report
+        count += amount
+        now = time.monotonic()
+        if now >= next_report:
+            next_report = now + _interval
+            callback(_report(label, count, start, total, False))
+
+    try:
+        yield step
+    finally:
+        callback(_report(label, count, start, total, True))
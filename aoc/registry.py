@@ -0,0 +1,79 @@
+"""
+  Maps (year, day) to the function that solves it.
+
+  The week modules are only imported when one of their days is
+  asked for. To know which days exist, the sources are scanned
+  for solve_day_* definitions instead of importing them.
+
+  namespace is the package holding the year packages, e.g. the
+  frozen copies in "reference". Empty for the solutions themselves.
+
+"""
+import functools
+import importlib
+import pathlib
+import re
+
+ROOT = pathlib.Path(__file__).parent.parent
+YEARS = (2015, 2016)
+
+
+@functools.lru_cache(maxsize=None)
+def _scan(year, namespace=""):
+    """ day -> (module name, function name) for a single year
+
+        When a day is defined in several weeks, the latest week wins.
+    """
+    found = {}
+    package = f"year{year}"
+    directory = ROOT.joinpath(namespace, package)
+    if namespace:
+        package = f"{namespace}.{package}"
+    weeks = sorted(directory.glob("week*.py"),
+                   key=lambda path: int(path.stem[len("week"):]))
+    for path in weeks:
+        source = path.read_text()
+        for matched in re.finditer(r"^def (solve_day_(\d+)\w*)\(", source,
+                                   re.MULTILINE):
+            function_name, day = matched.groups()
+            found[int(day)] = (f"{package}.{path.stem}", function_name)
+    return found
+
+
+def days(year=None, namespace=""):
+    """ All known (year, day) pairs, in order """
+    if year is not None and year not in YEARS:
+        raise LookupError(f"No solutions for {year}")
+    years = YEARS if year is None else (year, )
+    return [(a_year, day) for a_year in years
+            for day in sorted(_scan(a_year, namespace))]
+
+
+def select(year=None, day=None):
+    """ The known days of year (of all years when None), only day when
+        given. Raises LookupError when there are none.
+    """
+    found = [(a_year, a_day) for a_year, a_day in days(year)
+             if day is None or a_day == day]
+    if not found:
+        where = "" if year is None else f"{year} "
+        raise LookupError(f"No solution for {where}day {day}")
+    return found
+
+
+def locate(year, day, namespace=""):
+    """ The module and function name that solve the day """
+    try:
+        return _scan(year, namespace)[day]
+    except KeyError:
+        raise LookupError(f"No solution for {year} day {day}") from None
+
+
+def solver(year, day, namespace=""):
+    """ The solve_day_* function itself, importing its week when needed """
+    module_name, function_name = locate(year, day, namespace)
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def label(year, day):
+    return f"{year} day {day}"
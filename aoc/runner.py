@@ -0,0 +1,69 @@
+"""
+  Runs the solve_day_* functions of the year packages.
+
+  The days share no state, so they can be handed out to a pool of
+  processes. Only the year and day travel to a worker, the worker
+  looks the solution up in the registry itself. The answers are
+  still reported in day order.
+
+"""
+import concurrent.futures
+import os
+
+from . import answer_cache
+from . import md5mining
+from . import metrics
+from . import registry
+
+
+def run_day(year, day, use_cache=False):
+    """ Solves a single day, returns its metrics.Call """
+    solver = registry.solver(year, day)
+    if use_cache:
+        return metrics.measure(year, day,
+                               lambda: answer_cache.cached(year, day, solver))
+    return metrics.measure(year, day, solver)
+
+
+def run_parallel(jobs, workers=None, use_cache=False):
+    """ Solves all jobs on a process pool.
+
+        jobs is a list of (year, day).
+        Yields a metrics.Call per job in the order of jobs, as soon
+        as all the earlier jobs are done as well.
+    """
+    parallel = workers or os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=md5mining.set_workers,
+            initargs=(md5mining.share(parallel), )) as pool:
+        futures = [pool.submit(run_day, year, day, use_cache)
+                   for year, day in jobs]
+        for future in futures:
+            yield future.result()
+
+
+def run_sequential(jobs, use_cache=False):
+    """ Same as run_parallel, but in the current process """
+    for year, day in jobs:
+        yield run_day(year, day, use_cache)
+
+
+def solve(jobs, workers=None, use_cache=False, metrics_path=None):
+    """ Prints the answer of every job.
+
+        workers of None solves in this process, 0 uses all cores.
+        With use_cache, answers of earlier runs are reused.
+        With metrics_path, the metrics are written there at the end.
+    """
+    if workers is None:
+        calls = run_sequential(jobs, use_cache)
+    else:
+        calls = run_parallel(jobs, workers or None, use_cache)
+    for call in calls:
+        metrics.record(call)
+        print(f"{registry.label(call.year, call.day)}: {call.result} "
+              f"({call.wall:.2f}s)")
+    if use_cache:
+        answer_cache.evict()
+    if metrics_path:
+        metrics.write(metrics_path)
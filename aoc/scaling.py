@@ -0,0 +1,93 @@
+"""
+  Measures how a day scales with the size of its input.
+
+  Synthetic inputs of growing size are generated and solved, time
+  and peak memory are reported per size. The exponent column is the
+  growth between two sizes: 1 is linear, 2 quadratic, ...
+
+  Usage:
+    python3 -m aoc.scaling 2015 7 --sizes 100 200 400 800
+"""
+import argparse
+import json
+import math
+import random
+import tempfile
+import time
+
+from . import benchmark
+from . import generators
+from . import inputs
+from . import registry
+
+
+def measure_size(year, day, size, seed):
+    rng = random.Random(seed)
+    text = generators.generate(year, day, size, rng)
+    solver = registry.solver(year, day)
+    with tempfile.TemporaryDirectory() as directory:
+        with open(f"{directory}/day_{day}.txt", "w") as f:
+            f.write(text)
+        with inputs.redirected(directory):
+            with benchmark.cold():
+                start = time.perf_counter()
+                result = solver()
+                seconds = time.perf_counter() - start
+            peak = benchmark.peak_memory(solver)
+    return {
+        "size": size,
+        "bytes": len(text.encode()),
+        "seconds": seconds,
+        "peak_memory": peak,
+        "result": repr(result),
+    }
+
+
+def growth(previous, current, key):
+    """ Exponent k in key ~ size^k between two measurements """
+    if previous[key] <= 0 or current[key] <= 0:
+        return math.nan
+    return (math.log(current[key] / previous[key])
+            / math.log(current["size"] / previous["size"]))
+
+
+def scale(year, day, sizes, seed=0):
+    rows = []
+    print(f"{'size':>10} {'bytes':>12} {'seconds':>10} {'exp':>6} "
+          f"{'peak KiB':>12} {'exp':>6}")
+    for size in sizes:
+        row = measure_size(year, day, size, seed)
+        if rows:
+            time_exp = growth(rows[-1], row, "seconds")
+            memory_exp = growth(rows[-1], row, "peak_memory")
+        else:
+            time_exp = memory_exp = math.nan
+        print(f"{size:>10} {row['bytes']:>12} {row['seconds']:>10.4f} "
+              f"{time_exp:>6.2f} {row['peak_memory'] / 1024:>12.1f} "
+              f"{memory_exp:>6.2f}", flush=True)
+        rows.append(row)
+    return rows
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[100, 200, 400, 800])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Also write the results as JSON")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    rows = scale(args.year, args.day, sorted(args.sizes), args.seed)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"year": args.year, "day": args.day, "seed": args.seed,
+                       "sizes": rows}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
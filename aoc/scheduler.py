@@ -0,0 +1,221 @@
+"""
+  Runs the days longest first, each within a time budget.
+
+  How long every day took is kept in a history file. A run starts
+  the days that took longest the previous time first, so it doesn't
+  end waiting on a slow day that happened to be started last. Days
+  without history are started first of all.
+
+  Every day runs in a process of its own. A day that runs longer than
+  the budget is killed, together with any process it started, and
+  reported instead of hanging the whole run.
+
+  The process can also get a memory budget. Its address space is
+  limited (RLIMIT_AS), a day that needs more is reported as over
+  budget, with its peak RSS. Running out shows up in several ways: a
+  MemoryError, an ImportError or ENOMEM when a library can't be
+  mapped, or a library giving up and exiting (OpenBLAS does). The
+  limit is on virtual memory, which is more than the RSS: the
+  interpreter and its libraries reserve more address space than
+  they use.
+
+"""
+import collections
+import errno
+import json
+import multiprocessing
+import multiprocessing.connection
+import os
+import resource
+import signal
+import time
+
+from . import answer_cache
+from . import md5mining
+from . import metrics
+from . import registry
+from . import runner
+
+HISTORY = registry.ROOT.joinpath(".aoc_cache", "durations.json")
+
+Failed = collections.namedtuple("Failed", "year day seconds reason")
+
+
+def _history_key(year, day):
+    return f"{year}/{day}"
+
+
+def load_history(path=HISTORY):
+    """ "year/day" -> seconds it took the last time """
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_history(history, path=HISTORY):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f"{path}.{os.getpid()}"
+    with open(temporary, "w") as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+    os.replace(temporary, path)
+
+
+def longest_first(jobs, history):
+    """ The jobs without history, then the others longest first """
+    def expected(job):
+        return history.get(_history_key(*job), float("inf"))
+
+    return sorted(jobs, key=expected, reverse=True)
+
+
+def _over_budget(memory_limit, peak_rss):
+    return (f"over the memory budget of {memory_limit / 2**20:.0f} MiB "
+            f"(peak RSS {peak_rss / 2**20:.0f} MiB)")
+
+
+def _out_of_memory(error):
+    """ Whether error is how running out of address space showed up """
+    if isinstance(error, OSError):
+        return error.errno == errno.ENOMEM
+    return isinstance(error, (MemoryError, ImportError))
+
+
+def _solve(connection, year, day, use_cache, memory_limit):
+    try:
+        call = runner.run_day(year, day, use_cache)
+    except Exception as error:
+        if memory_limit is not None and _out_of_memory(error):
+            connection.send(("error",
+                             _over_budget(memory_limit, metrics.max_rss())))
+        else:
+            connection.send(("error", repr(error)))
+    else:
+        connection.send(("done", call))
+
+
+def _solve_in_child(connection, year, day, use_cache, memory_limit,
+                    mining_workers):
+    # A group of its own, so a kill also reaches the pools it starts.
+    os.setpgrp()
+    md5mining.set_workers(mining_workers)
+    # Before numpy is imported: OpenBLAS reserves buffers per thread,
+    # one per core doesn't fit a small budget.
+    os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+    if memory_limit is None:
+        _solve(connection, year, day, use_cache, memory_limit)
+        connection.close()
+        return
+
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard))
+    # Solved in a process of its own. When that exits without an
+    # answer, this one is left to report it with its peak RSS.
+    pid = os.fork()
+    if pid == 0:
+        try:
+            _solve(connection, year, day, use_cache, memory_limit)
+        finally:
+            os._exit(0)
+    _, status, usage = os.wait4(pid, 0)
+    if os.waitstatus_to_exitcode(status) != 0:
+        connection.send(("error",
+                         _over_budget(memory_limit, metrics.rss_bytes(usage))))
+    connection.close()
+
+
+def _kill(process):
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    process.join()
+
+
+def run(jobs, workers=1, timeout=None, use_cache=False, memory_limit=None,
+        history_path=HISTORY):
+    """ Solves the jobs longest first, at most workers at a time.
+
+        Yields a metrics.Call per solved job and a Failed per job that
+        ran over timeout seconds, over memory_limit bytes or raised,
+        in the order they finish.
+    """
+    history = load_history(history_path)
+    pending = collections.deque(longest_first(jobs, history))
+    running = {}
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                year, day = pending.popleft()
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(
+                    target=_solve_in_child,
+                    args=(sender, year, day, use_cache, memory_limit,
+                          md5mining.share(workers)))
+                process.start()
+                sender.close()
+                running[receiver] = (year, day, process, time.perf_counter())
+
+            wait_for = None
+            if timeout is not None:
+                first_start = min(start for *_, start in running.values())
+                wait_for = max(0, first_start + timeout - time.perf_counter())
+
+            for receiver in multiprocessing.connection.wait(list(running),
+                                                            wait_for):
+                year, day, process, start = running.pop(receiver)
+                try:
+                    status, payload = receiver.recv()
+                except EOFError:
+                    status, payload = "error", "exited without an answer"
+                receiver.close()
+                process.join()
+                if status != "done" and process.exitcode:
+                    payload += f" (exit code {process.exitcode})"
+                seconds = time.perf_counter() - start
+                history[_history_key(year, day)] = seconds
+                if status == "done":
+                    yield payload
+                else:
+                    yield Failed(year, day, seconds, payload)
+
+            now = time.perf_counter()
+            for receiver, (year, day, process, start) in list(running.items()):
+                if timeout is not None and now - start >= timeout:
+                    del running[receiver]
+                    _kill(process)
+                    receiver.close()
+                    # Remembered as long, so it starts first next time.
+                    history[_history_key(year, day)] = now - start
+                    yield Failed(year, day, now - start, "timeout")
+    finally:
+        for receiver, (_, _, process, _) in running.items():
+            _kill(process)
+            receiver.close()
+        save_history(history, history_path)
+
+
+def solve(jobs, workers=1, timeout=None, use_cache=False, metrics_path=None,
+          memory_limit=None):
+    """ Prints the answers as the days finish, returns the failed days.
+
+        With a memory_limit, the peak RSS of every day is printed too.
+    """
+    failed = []
+    for outcome in run(jobs, workers, timeout, use_cache, memory_limit):
+        label = registry.label(outcome.year, outcome.day)
+        if isinstance(outcome, Failed):
+            print(f"{label}: {outcome.reason} after {outcome.seconds:.2f}s")
+            failed.append(outcome)
+            continue
+        metrics.record(outcome)
+        usage = f"{outcome.wall:.2f}s"
+        if memory_limit is not None:
+            usage += f", peak RSS {outcome.max_rss / 2**20:.0f} MiB"
+        print(f"{label}: {outcome.result} ({usage})")
+    if use_cache:
+        answer_cache.evict()
+    if metrics_path:
+        metrics.write(metrics_path)
+    return failed
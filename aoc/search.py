@@ -0,0 +1,172 @@
+"""
+  Shortest path searches shared by the puzzles.
+
+  All searches take the same pluggable parts:
+    successors(state) yields (step_cost, next_state)
+    is_goal(state)    is checked when a state is taken from the frontier
+    heuristic(state)  estimate of the remaining cost (A* and greedy)
+    encode(state)     compact key of a state for the visited set
+
+  States are never copied or changed by the search, successors should
+  build new (immutable) states. Only the encoded keys are remembered,
+  so an encode that packs a state into a single int (see pack) keeps
+  the visited set small.
+
+  Every search returns the cost of the goal it found, or None. The
+  expanded states are counted in a progress tracker named label.
+
+  Several days depend on these, python3 -m aoc.search checks them on
+  small graphs they got wrong before.
+"""
+import collections
+import heapq
+import itertools
+
+from . import progress
+
+
+def _identity(state):
+    return state
+
+
+def pack(values, bits):
+    """ Packs small non negative ints into a single int, bits each """
+    packed = 0
+    for value in values:
+        packed = (packed << bits) | value
+    return packed
+
+
+def _best_first(start, successors, is_goal, priority, encode, close_on_pop,
+                label):
+    """ The heap based search all the others are built on.
+
+        With close_on_pop a state is only visited once it is taken
+        from the heap, which keeps Dijkstra and A* exact when a state
+        is reached again at a lower cost. Otherwise a state is visited
+        as soon as it is generated, which keeps the heap smaller.
+    """
+    visited = set()
+    if not close_on_pop:
+        visited.add(encode(start))
+    tie_breaker = itertools.count()
+    frontier = [(priority(0, start), 0, next(tie_breaker), start)]
+    with progress.tracking(label) as step:
+        while frontier:
+            _, cost, _, state = heapq.heappop(frontier)
+            if close_on_pop:
+                key = encode(state)
+                if key in visited:
+                    continue
+                visited.add(key)
+
+            # Checked on taking it, a cheaper path to the goal may
+            # still be on the heap when it is generated.
+            if is_goal(state):
+                return cost
+            step()
+            for step_cost, next_state in successors(state):
+                next_cost = cost + step_cost
+                key = encode(next_state)
+                if key in visited:
+                    continue
+                if not close_on_pop:
+                    visited.add(key)
+                heapq.heappush(frontier, (priority(next_cost, next_state),
+                                          next_cost, next(tie_breaker),
+                                          next_state))
+    return None
+
+
+def dijkstra(start, successors, is_goal, encode=_identity, label="dijkstra"):
+    return _best_first(start, successors, is_goal,
+                       lambda cost, state: cost, encode, True, label)
+
+
+def astar(start, successors, is_goal, heuristic, encode=_identity,
+          label="astar"):
+    """ Exact as long as the heuristic never overestimates """
+    return _best_first(start, successors, is_goal,
+                       lambda cost, state: cost + heuristic(state), encode,
+                       True, label)
+
+
+def greedy(start, successors, is_goal, heuristic, encode=_identity,
+           label="greedy"):
+    """ Always continues with the state closest to the goal.
+
+        Fast, but only finds the cheapest path when every path to the
+        goal costs the same.
+    """
+    return _best_first(start, successors, is_goal,
+                       lambda cost, state: heuristic(state), encode, False,
+                       label)
+
+
+def bfs(start, successors, is_goal, encode=_identity, label="bfs"):
+    """ Breadth first, for when every step costs the same.
+
+        As all steps cost the same, the first path found to the goal
+        is the cheapest, the goal is checked as soon as it's generated.
+    """
+    if is_goal(start):
+        return 0
+    visited = {encode(start)}
+    frontier = collections.deque([(0, start)])
+    with progress.tracking(label) as step:
+        while frontier:
+            cost, state = frontier.popleft()
+            step()
+            for step_cost, next_state in successors(state):
+                next_cost = cost + step_cost
+                if is_goal(next_state):
+                    return next_cost
+                key = encode(next_state)
+                if key not in visited:
+                    visited.add(key)
+                    frontier.append((next_cost, next_state))
+    return None
+
+
+def _expect(what, found, expected):
+    if found != expected:
+        raise AssertionError(f"{what}: {found}, expected {expected}")
+
+
+def check():
+    """ Raises AssertionError when a search gets a small case wrong """
+    # The direct edge to the goal is generated first, but costs more
+    # than the way around over b.
+    graph = {"a": [(10, "goal"), (1, "b")], "b": [(1, "goal")], "goal": []}
+
+    def successors(state):
+        return graph[state]
+
+    def is_goal(state):
+        return state == "goal"
+
+    def no_estimate(state):
+        return 0
+
+    _expect("dijkstra", dijkstra("a", successors, is_goal), 2)
+    _expect("astar", astar("a", successors, is_goal, no_estimate), 2)
+    _expect("dijkstra without a path",
+            dijkstra("b", lambda state: [], is_goal), None)
+
+    # The start can be the goal itself.
+    _expect("dijkstra from the goal", dijkstra("goal", successors, is_goal),
+            0)
+    _expect("astar from the goal",
+            astar("goal", successors, is_goal, no_estimate), 0)
+    _expect("greedy from the goal",
+            greedy("goal", successors, is_goal, no_estimate), 0)
+    _expect("bfs from the goal", bfs("goal", successors, is_goal), 0)
+
+
+def main():
+    check()
+    print("All searches give the expected costs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+  Streams the answers out the moment each day is solved.
+
+  The days run on a process pool driven from asyncio, at most workers
+  of them at a time, the ones that took longest in earlier scheduler
+  runs first. Every answer is printed as a JSON line as soon as
+  its day completes, a slow day doesn't hold back the days after it:
+    {"year": 2015, "day": 7, "answer": [16076, 2797], "seconds": 0.01,
+     "cpu_seconds": 0.01}
+  A day that raises gets an "error" instead of an answer.
+
+  With --sorted, the answers are repeated in day order for reading
+  once all days are done. That goes to stderr, so stdout stays JSON.
+
+  Usage:
+    python3 -m aoc.streaming 2016 --jobs 4 | consumer
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import os
+import json
+import sys
+
+from . import answer_cache
+from . import md5mining
+from . import metrics
+from . import registry
+from . import runner
+from . import scheduler
+
+
+async def _run_day(loop, pool, year, day, use_cache):
+    try:
+        call = await loop.run_in_executor(pool, runner.run_day, year, day,
+                                          use_cache)
+    except Exception as error:
+        return year, day, None, repr(error)
+    return year, day, call, None
+
+
+async def stream(jobs, workers=None, use_cache=False):
+    """ Yields (year, day, call, error) per job in the order they complete.
+
+        call is a metrics.Call, or None when the day raised error.
+        workers of None uses all cores. The days are started in the
+        order of jobs.
+    """
+    loop = asyncio.get_running_loop()
+    parallel = workers or os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=md5mining.set_workers,
+            initargs=(md5mining.share(parallel), )) as pool:
+        # Tasks, as as_completed would start bare coroutines in any order.
+        pending = [loop.create_task(_run_day(loop, pool, year, day, use_cache))
+                   for year, day in jobs]
+        for completed in asyncio.as_completed(pending):
+            yield await completed
+
+
+def as_json(year, day, call, error):
+    if call is None:
+        return json.dumps({"year": year, "day": day, "error": error})
+    return json.dumps({
+        "year": year,
+        "day": day,
+        "answer": call.result,
+        "seconds": call.wall,
+        "cpu_seconds": call.cpu,
+    })
+
+
+async def solve(jobs, workers=None, use_cache=False, ordered=False,
+                out=sys.stdout, human=sys.stderr):
+    """ Writes a JSON line per day to out as soon as it is solved.
+
+        With ordered, all answers are written to human in day order
+        at the end. Returns the number of days that raised.
+    """
+    outcomes = []
+    async for year, day, call, error in stream(jobs, workers, use_cache):
+        if call is not None:
+            metrics.record(call)
+        print(as_json(year, day, call, error), file=out, flush=True)
+        outcomes.append((year, day, call, error))
+    if use_cache:
+        answer_cache.evict()
+
+    if ordered:
+        for year, day, call, error in sorted(outcomes,
+                                             key=lambda o: o[:2]):
+            label = registry.label(year, day)
+            if call is None:
+                print(f"{label}: {error}", file=human)
+            else:
+                print(f"{label}: {call.result} ({call.wall:.2f}s)",
+                      file=human)
+    return sum(call is None for _, _, call, _ in outcomes)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("year", type=int, nargs="?")
+    parser.add_argument("day", type=int, nargs="?")
+    parser.add_argument("-j", "--jobs", type=int,
+                        help="days solved at the same time (default all cores)")
+    parser.add_argument("--cache", action="store_true",
+                        help="reuse answers of earlier runs")
+    parser.add_argument("--sorted", dest="ordered", action="store_true",
+                        help="repeat the answers in day order on stderr")
+    parser.add_argument("--metrics",
+                        help="write the metrics to this file at the end")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    try:
+        jobs = registry.select(args.year, args.day)
+    except LookupError as error:
+        sys.exit(str(error))
+    # The slow days first, so they don't end up waiting for a core.
+    jobs = scheduler.longest_first(jobs, scheduler.load_history())
+    failed = asyncio.run(solve(jobs, args.jobs, args.cache, args.ordered))
+    if args.metrics:
+        metrics.write(args.metrics)
+    if failed:
+        sys.exit(f"{failed} days failed")
+
+
+if __name__ == "__main__":
+    main()
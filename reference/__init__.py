@@ -0,0 +1,16 @@
+"""
+  Frozen copies of the solutions, used as oracles by aoc/differential.py.
+
+  Don't optimize these. They are the solutions as they were before any
+  optimization, the answers of year2015 and year2016 are checked
+  against them. They only use the standard library and their own
+  _inputs, none of the helpers in aoc, so a change to a shared helper
+  can't change both sides of a comparison.
+
+  Only the input handling differs: every day takes a puzzle_input
+  (see _inputs.py) and the inputs are read from the year packages.
+  2015 day 22 also returns the whole mana, as solutions.py printed it.
+  Some are slow, 2016 day 11 takes about a quarter of an hour on its
+  real input.
+
+"""
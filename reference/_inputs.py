@@ -0,0 +1,33 @@
+"""
+  The little input handling the frozen copies need, standard library only.
+
+  Like the solutions, an input is None (the file of the day), a path,
+  the content as str or bytes, or an open file.
+"""
+import io
+import os
+import re
+
+
+def read_text(puzzle_input):
+    """ The whole input as str """
+    if isinstance(puzzle_input, os.PathLike):
+        with open(puzzle_input, "r") as f:
+            return f.read()
+    if hasattr(puzzle_input, "read"):
+        puzzle_input = puzzle_input.read()
+    if isinstance(puzzle_input, (bytes, bytearray, memoryview)):
+        return bytes(puzzle_input).decode("utf8")
+    return puzzle_input
+
+
+def open_text(puzzle_input, default_path):
+    """ The input as a text file, to use in a with statement """
+    if puzzle_input is None:
+        return open(default_path, "r")
+    return io.StringIO(read_text(puzzle_input))
+
+
+def numbers(puzzle_input):
+    """ All integers in the input, in order """
+    return [int(n) for n in re.findall(r"-?\d+", read_text(puzzle_input))]
@@ -0,0 +1 @@
+""" Frozen copy of year2015, see reference/__init__.py """
@@ -0,0 +1 @@
+""" Frozen copy of year2016, see reference/__init__.py """
@@ -1,7 +1,66 @@
-import year2015
-import year2016
+import argparse
+import os
+import pathlib
+import sys
+
+from aoc import metrics
+from aoc import profiling
+from aoc import progress
+from aoc import registry
+from aoc import runner
+from aoc import scheduler
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Advent of code solutions")
+    parser.add_argument("year", type=int, nargs="?",
+                        help="Only solve this year")
+    parser.add_argument("day", type=int, nargs="?",
+                        help="Only solve this day of the year")
+    parser.add_argument(
+        "-j", "--jobs", type=int, nargs="?", const=0, default=None,
+        help="Solve the days in parallel on this many processes "
+        "(all cores when no count is given)")
+    parser.add_argument(
+        "--longest-first", action="store_true",
+        help="Start the days that took longest the last time first")
+    parser.add_argument(
+        "--timeout", type=float,
+        help="Kill and report a day that takes longer than this many "
+        "seconds (implies --longest-first)")
+    parser.add_argument(
+        "--memory-limit", type=int, metavar="MB",
+        help="Limit the address space of every day to this many MB and "
+        "report its peak RSS (implies --longest-first)")
+    parser.add_argument(
+        "--cache", action="store_true",
+        help="Reuse answers of earlier runs when neither the input "
+        "nor the solution changed")
+    parser.add_argument(
+        "--input",
+        help="Solve the day for this input file instead, - reads stdin")
+    parser.add_argument(
+        "--profile", choices=("cpu", "memory", "all"),
+        help="Profile the days with cProfile (cpu), tracemalloc (memory) "
+        "or both")
+    parser.add_argument("--profile-dir", default="profiles",
+                        help="Where the profiling reports are written")
+    parser.add_argument(
+        "--metrics",
+        help="Write timings and resource usage in the OpenMetrics format "
+        "to this file")
+    parser.add_argument("--metrics-port", type=int,
+                        help="Serve the metrics on this port during the run")
+    parser.add_argument(
+        "--progress", action="store_true",
+        help="Report the speed of the long loops on stderr every second")
+    return parser.parse_args()
+
+
+def solve_all():
+    import year2015
+    import year2016
 
-if __name__ == '__main__':
     print("Solving 2015")
     print(10 * "-")
     year2015.solve()
@@ -9,3 +68,57 @@ if __name__ == '__main__':
     print("Solving 2016")
     print(10 * "-")
     year2016.solve()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.progress:
+        progress.enable()
+    if args.input is not None:
+        if args.day is None:
+            sys.exit("--input needs a year and a day")
+        try:
+            solver = registry.solver(args.year, args.day)
+        except LookupError as error:
+            sys.exit(str(error))
+        if args.input == "-":
+            puzzle_input = sys.stdin
+        else:
+            puzzle_input = pathlib.Path(args.input)
+        print(solver(puzzle_input))
+    elif (args.year is None and args.jobs is None and not args.cache
+            and not args.profile and not args.metrics
+            and args.metrics_port is None and not args.longest_first
+            and args.timeout is None and args.memory_limit is None):
+        solve_all()
+    else:
+        try:
+            jobs = registry.select(args.year, args.day)
+        except LookupError as error:
+            sys.exit(str(error))
+        if args.profile:
+            profiling.profile(jobs, args.profile_dir,
+                              cpu=args.profile in ("cpu", "all"),
+                              memory=args.profile in ("memory", "all"))
+        else:
+            if args.metrics_port is not None:
+                metrics.serve(args.metrics_port)
+            memory_limit = None
+            if args.memory_limit is not None:
+                memory_limit = args.memory_limit * 1024 * 1024
+            if (args.longest_first or args.timeout is not None
+                    or memory_limit is not None):
+                workers = args.jobs
+                if workers is None:
+                    workers = 1
+                elif workers == 0:
+                    workers = os.cpu_count() or 1
+                failed = scheduler.solve(jobs, workers, args.timeout,
+                                         use_cache=args.cache,
+                                         metrics_path=args.metrics,
+                                         memory_limit=memory_limit)
+                if failed:
+                    sys.exit(f"{len(failed)} days failed")
+            else:
+                runner.solve(jobs, workers=args.jobs, use_cache=args.cache,
+                             metrics_path=args.metrics)
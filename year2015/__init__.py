@@ -12,13 +12,14 @@
   (with the main intention to have project stay a fun excercise.)
 
 """
-from .week1 import solve as solve_week_1
-from .week2 import solve as solve_week_2
-from .week3 import solve as solve_week_3
-from .week4 import solve as solve_week_4
 
 
 def solve():
+    from .week1 import solve as solve_week_1
+    from .week2 import solve as solve_week_2
+    from .week3 import solve as solve_week_3
+    from .week4 import solve as solve_week_4
+
     solve_week_1()
     solve_week_2()
     solve_week_3()
@@ -1,34 +1,78 @@
 import collections
-import hashlib
-import re
-import copy
 import itertools
 import pathlib
 
+from aoc import artifacts
+from aoc import checkpoint
+from aoc import inputs
+from aoc import md5mining
+from aoc import parsing
+
 
 def get_filepath(file_name):
     """ Returns the full path of the file_name"""
     return pathlib.Path(__file__).parent.joinpath(file_name).resolve()
 
 
-def solve_day_1_part_ab():
+def _first_below(block, position):
+    """ Index in block of the first step to floor -1, None if there is none.
+
+        Without numpy, a step at a time.
+    """
+    up, down = ord('('), ord(')')
+    for idx, c in enumerate(block):
+        if c == up:
+            position += 1
+        elif c == down:
+            position -= 1
+            if position == -1:
+                return idx
+    return None
+
+
+def solve_day_1_part_ab(puzzle_input=None):
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_1.txt"))
+    # Files come in one piece, they are handled a block at a time to
+    # keep the temporary arrays small, a few bytes per character.
+    BLOCK_SIZE = 1024 * 1024
+    if np is not None:
+        steps = np.zeros(256, dtype=np.int8)
+        steps[ord('(')] = 1
+        steps[ord(')')] = -1
+
     position = 0
     current_char = 0
     first_basement = 1e9
-    with open(get_filepath("day_1.txt"), "r") as f:
-        for l in f:
-            for ch in l:
-                current_char += 1
-                if ch == '(':
-                    position += 1
-                elif ch == ')':
-                    position -= 1
-                if position == -1:
-                    first_basement = min(first_basement, current_char)
+    for chunk in inputs.iter_chunks(puzzle_input):
+        for start in range(0, len(chunk), BLOCK_SIZE):
+            block = bytes(chunk[start:start + BLOCK_SIZE])
+            if first_basement == 1e9 and np is None:
+                below = _first_below(block, position)
+                if below is not None:
+                    first_basement = current_char + below + 1
+            elif first_basement == 1e9 and position < len(block):
+                # Relative to the start of the block, which fits int32.
+                # A block can't go down further than its length.
+                floors = np.cumsum(steps[np.frombuffer(block, np.uint8)],
+                                   dtype=np.int32)
+                # Every step is 1 floor, so the first one below the
+                # ground floor is on -1.
+                below = np.flatnonzero(floors == -1 - position)
+                if below.size:
+                    first_basement = current_char + int(below[0]) + 1
+            position += block.count(b"(") - block.count(b")")
+            current_char += len(block)
     return (position, first_basement)
 
 
-def solve_day_2_part_ab():
+def solve_day_2_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_2.txt"))
+
     def parse_box(line):
         l, w, h = line.strip().split("x")
         return int(l), int(w), int(h)
@@ -45,15 +89,16 @@ def solve_day_2_part_ab():
 
     total_area = 0
     total_ribbon = 0
-    with open(get_filepath("day_2.txt"), "r") as f:
-        for line in f:
-            l, w, h = parse_box(line)
-            total_area += wrapping_paper(l, w, h)
-            total_ribbon += ribbon(l, w, h)
+    for line in inputs.iter_lines(puzzle_input):
+        l, w, h = parse_box(line)
+        total_area += wrapping_paper(l, w, h)
+        total_ribbon += ribbon(l, w, h)
     return total_area, total_ribbon
 
 
-def solve_day_3_part_ab():
+def solve_day_3_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_3.txt"))
+
     def new_position(orig, direction):
         x, y = orig
         if direction == '^':
@@ -72,51 +117,49 @@ def solve_day_3_part_ab():
     been_there = collections.defaultdict(int)
     been_there[position] += 1
 
-    with open(get_filepath("day_3.txt"), "r") as f:
-        for line in f:
-            for ch in line:
-                position = new_position(position, ch)
-                been_there[position] += 1
-
     santa_position = (0, 0)
     robo_position = (0, 0)
     next_been = collections.defaultdict(int)
-    with open(get_filepath("day_3.txt"), "r") as f:
-        santa_move = True
-        for line in f:
-            for ch in line:
-                if santa_move:
-                    santa_position = new_position(santa_position, ch)
-                    next_been[santa_position] += 1
-                else:
-                    robo_position = new_position(robo_position, ch)
-                    next_been[robo_position] += 1
-                santa_move = not santa_move
-    return (len(been_there), len(next_been))
+    santa_move = True
 
+    # Both santa alone and santa with robo santa in a single pass.
+    for ch in inputs.read_text(puzzle_input):
+        position = new_position(position, ch)
+        been_there[position] += 1
+
+        if santa_move:
+            santa_position = new_position(santa_position, ch)
+            next_been[santa_position] += 1
+        else:
+            robo_position = new_position(robo_position, ch)
+            next_been[robo_position] += 1
+        santa_move = not santa_move
+    return (len(been_there), len(next_been))
 
-def solve_day_4_part_ab():
-    def generate_hashes(key):
-        ctr = 1
-        while True:
-            to_hash = key + str(ctr)
-            hash_obj = hashlib.md5(to_hash.encode("utf8"))
-            yield hash_obj.hexdigest()
-            ctr += 1
 
+def solve_day_4_part_ab(puzzle_input=None):
     key = "bgvyzdsv"
-    five_compare = "0" * 5
-    six_compare = "0" * 6
-    for five_zeros, hh in enumerate(generate_hashes(key), 1):
-        if hh.startswith(five_compare):
-            break
-    for six_zeros, hh in enumerate(generate_hashes(key), 1):
-        if hh.startswith(six_compare):
+    if puzzle_input is not None:
+        key = inputs.read_text(puzzle_input).strip()
+
+    # Every hash with 6 zeros also has 5, so a single run finds both.
+    name = checkpoint.checkpoint_name("2015/4", key)
+    five_zeros, last_hit = checkpoint.load(name) or (None, 0)
+    offer = checkpoint.periodic(name)
+    for six_zeros, digest in md5mining.mine(key.encode("utf8"), 5,
+                                            start=last_hit + 1):
+        if five_zeros is None:
+            five_zeros = six_zeros
+        if md5mining.has_leading_zeros(digest, 6):
             break
+        offer(lambda: (five_zeros, six_zeros))
+    checkpoint.remove(name)
     return (five_zeros, six_zeros)
 
 
-def solve_day_5_part_ab():
+def solve_day_5_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_5.txt"))
+
     def is_nice(line):
         num_vowels = len(list(filter(lambda c: c in "aeiou", line)))
         duplicated = any((a == b for a, b in zip(line, line[1:])))
@@ -135,147 +178,118 @@ def solve_day_5_part_ab():
 
     nice_strings = 0
     nice_strings_v2 = 0
-    with open(get_filepath("day_5.txt"), "r") as f:
-        for line in f:
-            nice_strings += is_nice(line)
-            nice_strings_v2 += is_nice_v2(line)
+    for line in inputs.iter_lines(puzzle_input):
+        nice_strings += is_nice(line)
+        nice_strings_v2 += is_nice_v2(line)
     return (nice_strings, nice_strings_v2)
 
 
-def solve_day_6_part_ab():
-    def parse_line(line):
-        result = re.match(
-            "(turn on|turn off|toggle) (\d+),(\d+) through (\d+),(\d+)",
-            line.strip())
-        return (result.group(1), (int(result.group(2)), int(result.group(3))),
-                (int(result.group(4)), int(result.group(5))))
+_light_instructions = parsing.grammar(
+    r"^(turn on|turn off|toggle) (\d+),(\d+) through (\d+),(\d+)",
+    None, int, int, int, int)
+
 
-    grid_v1 = [[False for _ in range(1000)] for _ in range(1000)]
-    grid_v2 = [[0 for _ in range(1000)] for _ in range(1000)]
+def solve_day_6_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_6.txt"))
+
+    from aoc import grid
+
+    grid_v1 = grid.new(1000, 1000)
+    grid_v2 = grid.new(1000, 1000, dtype=int)
 
     actions_v1 = {
-        "turn off": lambda prev: False,
-        "turn on": lambda prev: True,
-        "toggle": lambda prev: not prev
+        "turn off": lambda start, end: grid.assign(grid_v1, start, end, False),
+        "turn on": lambda start, end: grid.assign(grid_v1, start, end, True),
+        "toggle": lambda start, end: grid.toggle(grid_v1, start, end)
     }
     actions_v2 = {
-        "turn off": lambda prev: max(0, prev - 1),
-        "turn on": lambda prev: prev + 1,
-        "toggle": lambda prev: prev + 2
+        "turn off": lambda start, end: grid.add(grid_v2, start, end, -1, 0),
+        "turn on": lambda start, end: grid.add(grid_v2, start, end, 1),
+        "toggle": lambda start, end: grid.add(grid_v2, start, end, 2)
     }
 
-    def update(grid, start, end, action):
-        start_x, start_y = start
-        end_x, end_y = end
-        for y in range(start_y, end_y + 1):
-            row = grid[y]
-            for x in range(start_x, end_x + 1):
-                old_val = row[x]
-                row[x] = action(old_val)
-
-    with open(get_filepath("day_6.txt"), "r") as f:
-        for line in f:
-            current_action, start, end = parse_line(line)
-            action_v1 = actions_v1[current_action]
-            update(grid_v1, start, end, action_v1)
-
-            action_v2 = actions_v2[current_action]
-            update(grid_v2, start, end, action_v2)
-
-    total_lit = sum((sum(row) for row in grid_v1))
-    total_brightness = sum((sum(row) for row in grid_v2))
+    instructions = parsing.records(puzzle_input, _light_instructions)
+    for current_action, start_x, start_y, end_x, end_y in instructions:
+        start = (start_x, start_y)
+        end = (end_x, end_y)
+        actions_v1[current_action](start, end)
+        actions_v2[current_action](start, end)
+
+    total_lit = int(grid_v1.sum())
+    total_brightness = int(grid_v2.sum())
     return total_lit, total_brightness
 
 
-def solve_day_7_part_ab():
-    def and_fun(a, b):
-        return a & b
-
-    def or_fun(a, b):
-        return a | b
-
-    def make_lshift_fun(cnt):
-        return lambda a: (a << cnt) & 0xFFFF
-
-    def make_rshift_fun(cnt):
-        return lambda a: (a >> cnt) & 0xFFFF
-
-    def not_fun(a):
-        return 0xFFFF ^ a
-
-    def make_identity(a):
-        return lambda: a
-
-    def setter_fun(a):
-        return a
-
-    def compile_line(line):
-        line = line.strip()
-        ternary = re.match("([a-z]+) (AND|RSHIFT|LSHIFT|OR) (\w+) -> (\w+)",
-                           line)
-        binary = re.match("NOT ([a-z]+) -> ([a-z]+)", line)
-        constant = re.match("(\d+) -> (\w+)", line)
-        setter = re.match("([a-z]+) -> (\w+)", line)
-
-        ternary_const = re.match("(\d+) (AND|OR) (\w+) -> (\w+)", line)
-
-        target = None
-        result = None
-        if ternary_const:
-            val, op, arg2, target = ternary_const.groups()
-            val = int(val)
-            if "AND" == op:
-                result = (lambda a: and_fun(val, a), arg2)
-            elif "OR" == op:
-                result = (lambda a: or_fun(val, a), arg2)
-        elif ternary:
-            arg1, op, arg2, target = ternary.groups()
-            if "AND" == op:
-                result = (and_fun, arg1, arg2)
-            elif "RSHIFT" == op:
-                result = (make_rshift_fun(int(arg2)), arg1)
-            elif "LSHIFT" == op:
-                result = (make_lshift_fun(int(arg2))), arg1
-            elif "OR" == op:
-                result = (or_fun, arg1, arg2)
-        elif binary:
-            arg, target = binary.groups()
-            result = (not_fun, arg)
-        elif constant:
-            val, target = constant.groups()
-            result = (int(val), )
-        elif setter:
-            arg, target = setter.groups()
-            result = (setter_fun, arg)
-        else:
-            print(f"Unknown operand {line}")
-        return target, result
-
-    scope = collections.defaultdict(lambda: (0, ))
-    with open(get_filepath("day_7.txt"), "r") as f:
-        for line in f:
-            target, res = compile_line(line)
-            scope[target] = res
-
-    def solve(scope):
-        while not all((len(op) == 1 for op in scope.values())):
-            for name in list(scope.keys()):
-                act, *depend = scope[name]
-                if not depend:
-                    continue
-                resolved = all((len(scope[dd]) == 1 for dd in depend))
-                if not resolved:
-                    continue
-                vals = [scope[dd][0] for dd in depend]
-                scope[name] = (act(*vals), )
-        return scope
+# All gates in one pattern: [NOT] arg1 [OP arg2] -> target
+_wires = parsing.grammar(
+    r"^(?:(NOT) )?(\w+)(?: (AND|OR|LSHIFT|RSHIFT) (\w+))? -> (\w+)",
+    None, None, None, None, None)
 
-    solved_scope = solve(copy.deepcopy(scope))
-    scope_v2 = copy.deepcopy(scope)
-    scope_v2['b'] = solved_scope['a']
-    scope_v2 = solve(scope_v2)
 
-    return solved_scope['a'][0], scope_v2['a'][0]
+def solve_day_7_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_7.txt"))
+
+    operations = {
+        "SET": lambda a: a,
+        "NOT": lambda a: 0xFFFF ^ a,
+        "AND": lambda a, b: a & b,
+        "OR": lambda a, b: a | b,
+        "LSHIFT": lambda a, cnt: (a << cnt) & 0xFFFF,
+        "RSHIFT": lambda a, cnt: (a >> cnt) & 0xFFFF,
+    }
+
+    def parse_gate(negate, arg1, op, arg2):
+        """ (operation, *operands), operands are wire names or constants """
+        if negate:
+            return ("NOT", arg1)
+        elif op is None:
+            return ("SET", int(arg1) if arg1.isdigit() else arg1)
+        elif op in ("LSHIFT", "RSHIFT"):
+            return (op, arg1, int(arg2))
+        elif arg1.isdigit():
+            return (op, int(arg1), arg2)
+        return (op, arg1, arg2)
+
+    def parse_circuit(text):
+        """ target -> gate, only plain data so it can be stored """
+        return {
+            target: parse_gate(negate, arg1, op, arg2)
+            for negate, arg1, op, arg2, target in parsing.parse(_wires, text)
+        }
+
+    def solve(circuit, overrides):
+        """ The values of all wires. Wires without input are 0 """
+        values = dict(overrides)
+
+        def value(operand):
+            if isinstance(operand, int):
+                return operand
+            return values.get(operand, 0)
+
+        for wire in circuit:
+            # Depth first through the inputs, without recursing.
+            pending = [wire]
+            while pending:
+                target = pending[-1]
+                if target in values:
+                    pending.pop()
+                    continue
+                op, *operands = circuit[target]
+                missing = [
+                    operand for operand in operands
+                    if isinstance(operand, str) and operand not in values
+                    and operand in circuit
+                ]
+                if missing:
+                    pending.extend(missing)
+                else:
+                    values[target] = operations[op](*map(value, operands))
+                    pending.pop()
+        return values
+
+    circuit = artifacts.parsed(puzzle_input, parse_circuit, version=1)
+    wire_a = solve(circuit, {})["a"]
+    return wire_a, solve(circuit, {"b": wire_a})["a"]
 
 
 def solve():
@@ -1,38 +1,42 @@
 import collections
 import hashlib
-import re
 import copy
 import itertools
 import pathlib
 import json
 
+from aoc import inputs
+from aoc import parsing
+
 
 def get_filepath(file_name):
     """Returns the full path of the file_name"""
     return pathlib.Path(__file__).parent.joinpath(file_name).resolve()
 
 
-def solve_day_8_part_ab():
+def solve_day_8_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_8.txt"))
+
     def escape_str(line):
         return line.replace("\\", "\\\\").replace('"', '\\"')
 
     total_original = 0
     total_memory = 0
     total_more_escaped = 0
-    with open(get_filepath("day_8.txt"), "r") as f:
-        for line in f:
-            line = line.strip()
-            total_original += len(line)
-            total_memory += len(eval(line))
-            total_more_escaped += len(escape_str(line)) + 2
+    for line in inputs.lines(puzzle_input):
+        line = line.strip()
+        total_original += len(line)
+        total_memory += len(eval(line))
+        total_more_escaped += len(escape_str(line)) + 2
 
     return total_original - total_memory, total_more_escaped - total_original
 
 
-def solve_day_9_part_ab():
-    def parse(line):
-        matched = re.match("(\w+) to (\w+) = (\d+)", line)
-        return matched.group(1), matched.group(2), int(matched.group(3))
+_routes = parsing.grammar(r"^(\w+) to (\w+) = (\d+)", None, None, int)
+
+
+def solve_day_9_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_9.txt"))
 
     def path_cost(path, distances):
         total_cost = 0
@@ -56,18 +60,20 @@ def solve_day_9_part_ab():
 
     distances = {}
     cities = set()
-    with open(get_filepath("day_9.txt"), "r") as f:
-        for line in f:
-            src, dst, cost = parse(line)
-            distances[(src, dst)] = cost
-            distances[(dst, src)] = cost
-            cities.add(src)
-            cities.add(dst)
+    for src, dst, cost in parsing.records(puzzle_input, _routes):
+        distances[(src, dst)] = cost
+        distances[(dst, src)] = cost
+        cities.add(src)
+        cities.add(dst)
 
     return calc_shortest_path(cities, distances), calc_longest_path(cities, distances)
 
 
-def solve_day_10_part_ab():
+def solve_day_10_part_ab(puzzle_input=None):
+    start = "1113122113"
+    if puzzle_input is not None:
+        start = inputs.read_text(puzzle_input).strip()
+
     def look_and_say_step(start):
         result = []
         prev = next(start)
@@ -83,11 +89,11 @@ def solve_day_10_part_ab():
         yield cnt
         yield prev
 
-    puzzle_input = [int(d) for d in "1113122113"]
+    digits = [int(d) for d in start]
 
     v1_step_count = 40
     v2_step_count = 50
-    updated_v1 = iter(puzzle_input)
+    updated_v1 = iter(digits)
     for _ in range(v1_step_count):
         updated_v1 = look_and_say_step(updated_v1)
 
@@ -99,7 +105,11 @@ def solve_day_10_part_ab():
     return len(list(updated_v1)), len(list(updated_v2))
 
 
-def solve_day_11_part_ab():
+def solve_day_11_part_ab(puzzle_input=None):
+    current_password = "cqjxjnds"
+    if puzzle_input is not None:
+        current_password = inputs.read_text(puzzle_input).strip()
+
     alphabet = "abcdefghijklmnopqrstuvwxyz"
 
     def next_pass(val):
@@ -136,12 +146,13 @@ def solve_day_11_part_ab():
             password = next_pass(password)
         return password
 
-    password_v1 = search_next_pass(list("cqjxjnds"))
+    password_v1 = search_next_pass(list(current_password))
     password_v2 = search_next_pass(password_v1)
     return "".join(password_v1), "".join(password_v2)
 
 
-def solve_day_12_part_ab():
+def solve_day_12_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_12.txt"))
     IMPOSSIBLE_VAL = "1a"
 
     def recursively_add(data, forbidden_key=IMPOSSIBLE_VAL):
@@ -167,27 +178,20 @@ def solve_day_12_part_ab():
 
         return 0
 
-    with open(get_filepath("day_12.txt"), "r") as f:
-        data = json.load(f)
+    data = inputs.parsed(puzzle_input, json.loads)
 
     return recursively_add(data), recursively_add(data, "red")
 
 
-def solve_day_13_part_ab():
-    def parse_line(line):
-        split = re.match(
-            "(\w+) would (gain|lose) (\d+) happiness units by sitting next to (\w+)",
-            line,
-        )
-        assert split, f"{line} doesn't match"
+_happiness = parsing.grammar(
+    r"^(\w+) would (gain|lose) (\d+) happiness units by sitting next to (\w+)",
+    None, None, int, None)
 
-        source_person = split.group(1)
-        target_person = split.group(4)
 
-        sign_table = {"gain": 1, "lose": -1}
-        happiness = sign_table[split.group(2)] * int(split.group(3))
+def solve_day_13_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_13.txt"))
 
-        return source_person, target_person, happiness
+    sign_table = {"gain": 1, "lose": -1}
 
     def total_happiness(seating, scores):
         summed = 0
@@ -201,12 +205,11 @@ def solve_day_13_part_ab():
 
     happiness_matrix = collections.defaultdict(lambda: 0)
     family = set()
-    with open(get_filepath("day_13.txt"), "r") as f:
-        for line in f:
-            src, trg, happiness = parse_line(line)
-            happiness_matrix[(src, trg)] = happiness
-            family.add(src)
-            family.add(trg)
+    for src, sign, amount, trg in parsing.records(puzzle_input, _happiness):
+        happiness = sign_table[sign] * amount
+        happiness_matrix[(src, trg)] = happiness
+        family.add(src)
+        family.add(trg)
 
     most_hapiness = -1e9
     for seating in itertools.permutations(family):
@@ -222,17 +225,13 @@ def solve_day_13_part_ab():
     return most_hapiness, most_hapiness_with_me
 
 
-def solve_day_14_part_ab():
-    def parse_line(line):
-        line_fmt = "(\w+) can fly (\d+) km/s for (\d+) seconds, but then must rest for (\d+) seconds."
-        splitted = re.match(line_fmt, line)
-        assert splitted, f"Can't parse {line}"
-        return (
-            splitted.group(1),
-            int(splitted.group(2)),
-            int(splitted.group(3)),
-            int(splitted.group(4)),
-        )
+_reindeers = parsing.grammar(
+    r"^(\w+) can fly (\d+) km/s for (\d+) seconds, "
+    r"but then must rest for (\d+) seconds\.", None, int, int, int)
+
+
+def solve_day_14_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_14.txt"))
 
     def distance(avail_time, speed, travel_period, rest_period):
         travelled = 0
@@ -267,10 +266,9 @@ def solve_day_14_part_ab():
 
     reindeers = {}
     trial_seconds = 2503
-    with open(get_filepath("day_14.txt"), "r") as f:
-        for line in f:
-            name, speed, duration, rest_period = parse_line(line)
-            reindeers[name] = (speed, duration, rest_period)
+    for name, speed, duration, rest_period in parsing.records(
+            puzzle_input, _reindeers):
+        reindeers[name] = (speed, duration, rest_period)
     return race_v1(trial_seconds, reindeers), race_v2(trial_seconds, reindeers)
 
 
@@ -1,17 +1,29 @@
 import pathlib
 import functools
 import re
-import heapq
 import itertools
 import collections
 
+from aoc import artifacts
+from aoc import checkpoint
+from aoc import inputs
+from aoc import parsing
+from aoc import progress
+from aoc import search
+
 
 def get_filepath(file_name):
     """Returns the full path of the file_name"""
     return pathlib.Path(__file__).parent.joinpath(file_name).resolve()
 
 
-def solve_day_15_part_ab():
+_ingredients = parsing.grammar(
+    r"^(\w+): capacity (-?\d+), durability (-?\d+), flavor (-?\d+), "
+    r"texture (-?\d+), calories (-?\d+)", None, int, int, int, int, int)
+
+
+def solve_day_15_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_15.txt"))
     class Ingredient(object):
         """
         Helper class to easily:
@@ -56,38 +68,22 @@ def solve_day_15_part_ab():
         def __repr__(self):
             return f"Ingredient: {self.__dict__}"
 
-    def parse_line(line):
-        matched = re.match(
-            "(\w+): capacity (-?\d+), durability (-?\d+), flavor (-?\d+), texture (-?\d+), calories (-?\d+)",
-            line,
-        )
-        assert matched, line
-        return matched.group(1), Ingredient(
-            int(matched.group(2)),
-            int(matched.group(3)),
-            int(matched.group(4)),
-            int(matched.group(5)),
-            int(matched.group(6)),
-        )
-
     def split_into_parts(total, nparts):
         """
-        Returns a list of nparts whose sum is total.
+        Yields all lists of nparts whose sum is total.
         """
         if nparts == 1:
-            return [[total]]
+            yield [total]
+            return
 
-        results = []
         for p in range(total + 1):
             for child in split_into_parts(total - p, nparts - 1):
-                results.append([p] + child)
-        return results
+                yield [p] + child
 
-    ingredients = []
-    with open(get_filepath("day_15.txt"), "r") as f:
-        for line in f:
-            _, stuff = parse_line(line)
-            ingredients.append(stuff)
+    ingredients = [
+        Ingredient(*properties)
+        for _, *properties in parsing.records(puzzle_input, _ingredients)
+    ]
 
     best_score_v1 = 0
     best_score_v2 = 0
@@ -107,16 +103,19 @@ def solve_day_15_part_ab():
     return best_score_v1, best_score_v2
 
 
-def solve_day_16_part_ab():
-    def parse_line(line):
-        matched = re.match("Sue (\d+): (.*)", line)
-        assert matched, line
-        sue_number = int(matched.group(1))
-        character = {}
-        for identifier in matched.group(2).split(", "):
-            part, count = identifier.split(":")
-            character[part] = int(count)
-        return sue_number, character
+_thing = re.compile(r"(\w+): (\d+)")
+
+
+def _read_things(text):
+    """ 'cats: 7, trees: 3' as {'cats': 7, 'trees': 3} """
+    return {part: int(count) for part, count in _thing.findall(text)}
+
+
+_sues = parsing.grammar(r"^Sue (\d+): (.*)$", int, _read_things)
+
+
+def solve_day_16_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_16.txt"))
 
     def equal_cmp(key, sub_value, super_value):
         return sub_value == super_value
@@ -152,20 +151,20 @@ def solve_day_16_part_ab():
 
     gifting_sue_v1 = -1
     gifting_sue_v2 = -1
-    with open(get_filepath("day_16.txt"), "r") as f:
-        for line in f:
-            sue_number, identifiers = parse_line(line)
-            if is_sub_dict(identifiers, to_match):
-                assert gifting_sue_v1 == -1
-                gifting_sue_v1 = sue_number
-            if is_sub_dict(identifiers, to_match, fuzzy_compare):
-                assert gifting_sue_v2 == -1
-                gifting_sue_v2 = sue_number
+    for sue_number, identifiers in parsing.records(puzzle_input, _sues):
+        if is_sub_dict(identifiers, to_match):
+            assert gifting_sue_v1 == -1
+            gifting_sue_v1 = sue_number
+        if is_sub_dict(identifiers, to_match, fuzzy_compare):
+            assert gifting_sue_v2 == -1
+            gifting_sue_v2 = sue_number
 
     return gifting_sue_v1, gifting_sue_v2
 
 
-def solve_day_17_part_ab():
+def solve_day_17_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_17.txt"))
+
     def calc_combos(total, containers):
         if len(containers) == 1:
             [size] = containers
@@ -183,8 +182,8 @@ def solve_day_17_part_ab():
             for other in calc_combos(total, other_sizes):
                 yield other
 
-    with open(get_filepath("day_17.txt"), "r") as f:
-        container_sizes = tuple(sorted([int(c) for c in f]))
+    lines = inputs.lines(puzzle_input)
+    container_sizes = tuple(sorted([int(c) for c in lines]))
 
     total_eggnog = 150
     combos = list(calc_combos(total_eggnog, container_sizes))
@@ -194,61 +193,34 @@ def solve_day_17_part_ab():
     return len(combos), len(minimal_count)
 
 
-def solve_day_18_part_ab():
-    def neighbours(x, y, max_c=100):
-        lower_x = max(0, x - 1)
-        upper_x = min(x + 2, max_c)
-
-        lower_y = max(0, y - 1)
-        upper_y = min(y + 2, max_c)
-
-        all_neighbours = (
-            (nx, ny) for nx in range(lower_x, upper_x) for ny in range(lower_y, upper_y)
-        )
-        return [(nx, ny) for nx, ny in all_neighbours if nx != x or ny != y]
-
-    def count_lights(grid):
-        total = 0
-        for row in grid:
-            total += sum(row)
-        return total
-
-    def update_grid(old_grid):
-        new_grid = []
-        for x, old_row in enumerate(old_grid):
-            new_row = []
-            for y, val in enumerate(old_row):
-                nvals = sum(map(lambda cor: old_grid[cor[0]][cor[1]], neighbours(x, y)))
-                next_val = nvals == 3 or (val and nvals == 2)
-                new_row.append(next_val)
-            new_grid.append(new_row)
-        return new_grid
+def solve_day_18_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_18.txt"))
+    from aoc import grid
 
     def light_up_the_corner(grid_v2):
-        grid_v2[0][0] = True
-        grid_v2[99][0] = True
-        grid_v2[0][99] = True
-        grid_v2[99][99] = True
+        grid_v2[0, 0] = True
+        grid_v2[-1, 0] = True
+        grid_v2[0, -1] = True
+        grid_v2[-1, -1] = True
         return grid_v2
 
-    grid = []
-    with open(get_filepath("day_18.txt"), "r") as f:
-        for line in f:
-            grid.append(["#" == c for c in line.strip()])
+    lights = grid.from_lines(line.strip() for line in inputs.lines(puzzle_input))
 
-    grid_v1 = grid
+    grid_v1 = lights
     for _ in range(100):
-        grid_v1 = update_grid(grid_v1)
+        grid_v1 = grid.life_step(grid_v1)
 
-    grid_v2 = light_up_the_corner(grid)
+    grid_v2 = light_up_the_corner(lights.copy())
     for _ in range(100):
-        grid_v2 = update_grid(grid_v2)
+        grid_v2 = grid.life_step(grid_v2)
         grid_v2 = light_up_the_corner(grid_v2)
 
-    return count_lights(grid_v1), count_lights(grid_v2)
+    return int(grid_v1.sum()), int(grid_v2.sum())
 
 
-def solve_day_19_part_ab():
+def solve_day_19_part_ab(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_19.txt"))
+
     def read_replacement(line):
         matched = re.match("(\w+) => (\w+)", line)
         if matched:
@@ -263,37 +235,60 @@ def solve_day_19_part_ab():
                 idx = line.find(start, idx + 1)
 
     def best_first_search(start, end, replacements):
-        results = [(len(start), 1, start)]
-        seen = set()
-        while True:
-            best_score, steps, best_val = heapq.heappop(results)
-            for a in step_replacements(best_val, replacements):
-                if a == end:
-                    return steps
-                if a not in seen:
-                    heapq.heappush(results, (len(a), steps + 1, a))
-
-    replacements = []
-    target = ""
-    with open(get_filepath("day_19.txt"), "r") as f:
-        for line in f:
+        # Every way back to 'e' takes the same number of steps,
+        # so greedily shrinking the molecule is good enough.
+        return search.greedy(
+            start,
+            lambda molecule: ((1, a) for a in step_replacements(
+                molecule, replacements)),
+            lambda molecule: molecule == end,
+            len)
+
+    def read_machine(text):
+        """ The replacements and the medicine molecule """
+        replacements = []
+        target = ""
+        for line in text.splitlines():
             line = line.strip()
             conversion = read_replacement(line)
             if conversion:
-                start, end = conversion
-                replacements.append((start, end))
+                replacements.append(conversion)
             elif line:
                 target = line
+        return tuple(replacements), target
 
+    replacements, target = artifacts.parsed(puzzle_input, read_machine,
+                                            version=1)
     all_replacements = set(step_replacements(target, replacements))
     reverse_replace = [(end, start) for start, end in replacements]
     return len(all_replacements), best_first_search(target, "e", reverse_replace)
 
 
-def solve_day_20_part_ab():
-    def adding():
+def solve_day_20_part_ab(puzzle_input=None):
+    many_presents = 34000000
+    if puzzle_input is not None:
+        many_presents = int(inputs.read_text(puzzle_input))
+
+    # houses holds the elves that still have to visit the houses
+    # after idx. It is too big to save every few seconds, only idx is
+    # checkpointed and houses is rebuilt from it: every elf up to idx
+    # visits its next multiple after idx.
+    def resumed(idx):
+        houses = collections.defaultdict(list)
+        for elf_idx in range(1, idx + 1):
+            houses[(idx // elf_idx + 1) * elf_idx].append(elf_idx)
+        return houses
+
+    def limited_resumed(idx):
         houses = collections.defaultdict(list)
-        for idx in itertools.count(1):
+        for elf_idx in range(1, idx + 1):
+            visit = idx // elf_idx + 1
+            if visit <= 50:
+                houses[visit * elf_idx].append((elf_idx, 51 - visit))
+        return houses
+
+    def adding(houses, start):
+        for idx in itertools.count(start):
             current = houses[idx]
             current.append(idx)
             summed = 0
@@ -301,11 +296,10 @@ def solve_day_20_part_ab():
                 houses[idx + c].append(c)
                 summed += c
             del houses[idx]
-            yield summed * 10
+            yield idx, summed * 10
 
-    def limited_adding():
-        houses = collections.defaultdict(list)
-        for idx in itertools.count(1):
+    def limited_adding(houses, start):
+        for idx in itertools.count(start):
             current = houses[idx]
             current.append((idx, 50))
             summed = 0
@@ -314,20 +308,51 @@ def solve_day_20_part_ab():
                 if count > 1:
                     houses[idx + elf_idx].append((elf_idx, count - 1))
             del houses[idx]
-            yield summed * 11
+            yield idx, summed * 11
+
+    # The houses are cheap, checking the clock for each one is not.
+    OFFER_EVERY = 4096
+    name = checkpoint.checkpoint_name("2015/20", many_presents)
+    offer = checkpoint.periodic(name)
+    idx_v1, idx = checkpoint.load(name) or (None, 0)
+
+    # House n gets at least 10 * n presents, which bounds the search.
+    if idx_v1 is None:
+        with progress.tracking("2015/20 houses",
+                               many_presents // 10 - idx) as step:
+            for idx_v1, presents in adding(resumed(idx), idx + 1):
+                if presents >= many_presents:
+                    break
+                if idx_v1 % OFFER_EVERY == 0:
+                    offer(lambda: (None, idx_v1))
+                    step(OFFER_EVERY)
+        idx = 0
+    with progress.tracking("2015/20 limited houses",
+                           many_presents // 11 - idx) as step:
+        for idx_v2, presents in limited_adding(limited_resumed(idx), idx + 1):
+            if presents >= many_presents:
+                break
+            if idx_v2 % OFFER_EVERY == 0:
+                offer(lambda: (idx_v1, idx_v2))
+                step(OFFER_EVERY)
+
+    checkpoint.remove(name)
+    return idx_v1, idx_v2
 
-    many_presents = 34000000
-    for idx_v1, presents in enumerate(adding(), start=1):
-        if presents >= many_presents:
-            break
-    for idx_v2, presents in enumerate(limited_adding(), start=1):
-        if presents >= many_presents:
-            break
 
-    return idx_v1, idx_v2
+def solve_day_21_part_ab(puzzle_input=None):
+    def read_boss(text):
+        boss = {}
+        for line in text.splitlines():
+            if line.strip():
+                name, value = line.split(":")
+                boss[name.strip()] = int(value)
+        return boss
 
+    boss = {"Hit Points": 100, "Damage": 8, "Armor": 2}
+    if puzzle_input is not None:
+        boss = read_boss(inputs.read_text(puzzle_input))
 
-def solve_day_21_part_ab():
     weapons = [(8, 4, 0), (10, 5, 0), (25, 6, 0), (40, 7, 0), (74, 8, 0)]
     armors = [(0, 0, 0), (13, 0, 1), (31, 0, 2), (53, 0, 3), (75, 0, 4), (102, 0, 5)]
     rings = [(25, 1, 0), (50, 2, 0), (100, 3, 0), (20, 0, 1), (40, 0, 2), (80, 0, 3)]
@@ -354,9 +379,9 @@ def solve_day_21_part_ab():
 
     def play(attack, defense):
         player_health = 100
-        boss_health = 100
-        boss_attack = 8
-        boss_def = 2
+        boss_health = boss["Hit Points"]
+        boss_attack = boss["Damage"]
+        boss_def = boss["Armor"]
         while True:
             boss_health -= max(1, attack - boss_def)
             if boss_health <= 0:
@@ -376,125 +401,6 @@ def solve_day_21_part_ab():
     return cheapest_win(), most_expensive_loss()
 
 
-def solve_day_22_part_ab():
-    import copy
-    import random
-
-    CAST_ANY_TIME = -1
-
-    def boss_turn(timer, player, boss):
-      MINIMUM_DAMAGE = 1 
-      player_damage = max(boss_damage - player['armor'], MINIMUM_DAMAGE)
-      player['hit_points'] -= player_damage
-      return CAST_ANY_TIME
- 
-    def magic_missle(timer, player, boss):
-      boss['hit_points'] -= 4
-      return CAST_ANY_TIME
-      
-    def drain(timer, player, boss):
-      boss['hit_points'] -= 2
-      player['hit_points'] += 2
-      return CAST_ANY_TIME
-      
-    def shield(timer, player, boss):
-      player['armor'] += 7
-      until = timer + 5
-      def apply_effect(timer, player, boss):
-        should_continue= timer <= until
-        if not should_continue:
-          player['armor'] -= 7
-        return should_continue 
-      player['effects'].append(apply_effect)
-      return until 
-
-    def poison(timer, player, boss):
-      until = timer + 5 
-      def apply_effect(timer, player, boss):
-        boss['hit_points'] -= 3
-        return timer <= until
-      player['effects'].append(apply_effect)
-      return until 
-
-    def recharge(timer, player, boss):
-      until = timer + 4
-      def apply_effect(timer, player, boss):
-        player['mana'] += 101
-        return timer <= until
-      player['effects'].append(apply_effect)
-      return until 
-
-    boss_hit_points= 51
-    boss_damage= 9
-
-    default_spells = [(CAST_ANY_TIME, 53, magic_missle), (CAST_ANY_TIME, 73, drain),
-                      (CAST_ANY_TIME, 113, shield), (CAST_ANY_TIME, 173, poison),
-                      (CAST_ANY_TIME, 229, recharge) ]
-
-    player = {'hit_points': 50, 'mana':500, 'spells': default_spells, 'effects': [], 'armor': 0}
-    boss = {'hit_points': boss_hit_points}
-    world = {"timer": 1, "player": player, "boss": boss}
-
-
-    def apply_effects(world, effects) -> list:
-        new_effects = []
-        for effect in effects:
-          result = effect(**world)
-          if result:
-            new_effects.append(effect)
-        return new_effects
-
-    def default_turn_effect(timer, player, boss):
-      pass
-
-    def hard_mode(timer, player, boss):
-      #if timer % 2 == 1:
-      player["hit_points"] -= 1
-
-    def search(world, difficulty=default_turn_effect):
-      moves = [(0 , world)]
-      while moves:
-        mana_cost, best_world = heapq.heappop(moves) 
-        best_world = copy.deepcopy(best_world)
-  
-        
-        difficulty(**best_world)
-
-        if  best_world["player"]["hit_points"] <= 0:
-          continue
-
-        if  best_world["boss"]["hit_points"] < 0:
-          return mana_cost
-
-
-
-        best_world["player"]["effects"] = apply_effects(best_world, best_world["player"]["effects"])
-  
-        is_boss_turn = (best_world["timer"] % 2) == 0
-        best_world["timer"] += 1
-  
-        if is_boss_turn:
-          boss_turn(**best_world)
-          if best_world["player"]["hit_points"] >= 0:
-            heapq.heappush(moves, (mana_cost, best_world))
-        else:
-          for idx, (until, spell_cost, pick) in enumerate(best_world["player"]["spells"]):
-            if until <= best_world["timer"] and spell_cost < best_world["player"]["mana"]:
-              new_world = copy.deepcopy(best_world)
-              new_until = pick(**new_world)
-              new_world["player"]["spells"][idx] = (new_until, spell_cost, pick)
-              new_world["player"]['mana'] -= spell_cost
-  
-              new_mana_cost = mana_cost + spell_cost
-              new_mana_cost += random.random() / 1e3 # Make every value unique 
-              if new_world["boss"]["hit_points"] <= 0:
-                return new_mana_cost
-              else:
-                heapq.heappush(moves, (new_mana_cost, new_world))
-       
-    return search(world), search(world, hard_mode)
-  
-
 def solve():
     day15_a, day15_b = solve_day_15_part_ab()
     print(f"Day15a: Highest scoring cookie reaches {day15_a} points")
@@ -1,154 +1,131 @@
 import pathlib
 import functools
 import re
-import heapq
 import itertools
 import collections
 
+from aoc import inputs
+from aoc import search
+
 
 def get_filepath(file_name):
     """Returns the full path of the file_name"""
     return pathlib.Path(__file__).parent.joinpath(file_name).resolve()
 
-def solve_day_22_part_ab():
-    import copy
-    import random
-
-    CAST_ANY_TIME = -1
+def solve_day_22_part_ab(puzzle_input=None):
+    def read_boss(text):
+        boss = {}
+        for line in text.splitlines():
+            if line.strip():
+                name, value = line.split(":")
+                boss[name.strip()] = int(value)
+        return boss
 
-    def boss_turn(timer, player, boss):
-        MINIMUM_DAMAGE = 1
-        player_damage = max(boss_damage - player['armor'], MINIMUM_DAMAGE)
-        player['hit_points'] -= player_damage
-        return CAST_ANY_TIME
-
-    def magic_missle(timer, player, boss):
-        boss['hit_points'] -= 4
-        return CAST_ANY_TIME
-
-    def drain(timer, player, boss):
-        boss['hit_points'] -= 2
-        player['hit_points'] += 2
-        return CAST_ANY_TIME
-
-    def shield(timer, player, boss):
-        player['armor'] += 7
-        until = timer + 5
-
-        def apply_effect(timer, player, boss):
-            should_continue = timer <= until
-            if not should_continue:
-                player['armor'] -= 7
-            return should_continue
-
-        player['effects'].append(apply_effect)
-        return until
-
-    def poison(timer, player, boss):
-        until = timer + 5
-
-        def apply_effect(timer, player, boss):
-            boss['hit_points'] -= 3
-            return timer <= until
-
-        player['effects'].append(apply_effect)
-        return until
-
-    def recharge(timer, player, boss):
-        until = timer + 4
-
-        def apply_effect(timer, player, boss):
-            player['mana'] += 101
-            return timer <= until
-
-        player['effects'].append(apply_effect)
-        return until
-
-    boss_hit_points = 51
-    boss_damage = 9
-    default_spells = [(CAST_ANY_TIME, 53, magic_missle),
-                      (CAST_ANY_TIME, 73, drain), (CAST_ANY_TIME, 113, shield),
-                      (CAST_ANY_TIME, 173, poison),
-                      (CAST_ANY_TIME, 229, recharge)]
-
-    player = {
-        'hit_points': 50,
-        'mana': 500,
-        'spells': default_spells,
-        'effects': [],
-        'armor': 0
-    }
-    boss = {'hit_points': boss_hit_points}
-    world = {"timer": 1, "player": player, "boss": boss}
-
-    def apply_effects(world, effects) -> list:
-        new_effects = []
-        for effect in effects:
-            result = effect(**world)
-            if result:
-                new_effects.append(effect)
-        return new_effects
-
-    def default_turn_effect(timer, player, boss):
-        pass
-
-    def hard_mode(timer, player, boss):
-        #if timer % 2 == 1:
-        player["hit_points"] -= 1
-
-    def search(world, difficulty=default_turn_effect):
-        moves = [(0, world)]
-        while moves:
-            mana_cost, best_world = heapq.heappop(moves)
-            best_world = copy.deepcopy(best_world)
-
-            difficulty(**best_world)
-
-            if best_world["player"]["hit_points"] <= 0:
-                continue
+    boss_stats = {"Hit Points": 51, "Damage": 9}
+    if puzzle_input is not None:
+        boss_stats = read_boss(inputs.read_text(puzzle_input))
 
-            if best_world["boss"]["hit_points"] < 0:
-                return mana_cost
+    CAST_ANY_TIME = -1
+    MAGIC_MISSLE, DRAIN, SHIELD, POISON, RECHARGE = range(5)
+    spell_costs = (53, 73, 113, 173, 229)
+    durations = {SHIELD: 5, POISON: 5, RECHARGE: 4}
+
+    boss_damage = boss_stats["Damage"]
+
+    # A world is an immutable tuple:
+    #   (timer, hit points, mana, armor, boss hit points, spells, effects)
+    # spells holds, per spell, the timer from which it can be cast again.
+    # effects is a sorted tuple of (spell, until) for the running effects.
+    world = (1, 50, 500, 0, boss_stats["Hit Points"],
+             (CAST_ANY_TIME, ) * len(spell_costs), ())
+
+    def apply_effects(timer, mana, armor, boss_hit_points, effects):
+        remaining = []
+        for spell, until in effects:
+            if spell == POISON:
+                boss_hit_points -= 3
+            elif spell == RECHARGE:
+                mana += 101
+            if timer <= until:
+                remaining.append((spell, until))
+            elif spell == SHIELD:
+                armor -= 7
+        return mana, armor, boss_hit_points, tuple(remaining)
+
+    def cast(spell, timer, hit_points, mana, armor, boss_hit_points, spells,
+             effects):
+        until = CAST_ANY_TIME
+        if spell == MAGIC_MISSLE:
+            boss_hit_points -= 4
+        elif spell == DRAIN:
+            boss_hit_points -= 2
+            hit_points += 2
+        else:
+            until = timer + durations[spell]
+            effects = tuple(sorted(effects + ((spell, until), )))
+            if spell == SHIELD:
+                armor += 7
+        spells = spells[:spell] + (until, ) + spells[spell + 1:]
+        mana -= spell_costs[spell]
+        return (timer, hit_points, mana, armor, boss_hit_points, spells,
+                effects)
+
+    def turns(penalty):
+        """ The next worlds and their mana cost.
+
+            penalty is the damage taken at the start of every turn.
+        """
+        def next_worlds(world):
+            timer, hit_points, mana, armor, boss_hit_points, spells, effects = world
+            hit_points -= penalty
+            if hit_points <= 0:
+                return
 
-            best_world["player"]["effects"] = apply_effects(
-                best_world, best_world["player"]["effects"])
+            mana, armor, boss_hit_points, effects = apply_effects(
+                timer, mana, armor, boss_hit_points, effects)
 
-            is_boss_turn = (best_world["timer"] % 2) == 0
-            best_world["timer"] += 1
+            is_boss_turn = (timer % 2) == 0
+            timer += 1
 
             if is_boss_turn:
-                boss_turn(**best_world)
-                if best_world["player"]["hit_points"] >= 0:
-                    heapq.heappush(moves, (mana_cost, best_world))
+                MINIMUM_DAMAGE = 1
+                hit_points -= max(boss_damage - armor, MINIMUM_DAMAGE)
+                if hit_points >= 0:
+                    yield 0, (timer, hit_points, mana, armor, boss_hit_points,
+                              spells, effects)
             else:
-                for idx, (until, spell_cost,
-                          pick) in enumerate(best_world["player"]["spells"]):
-                    if until <= best_world["timer"] and spell_cost < best_world[
-                            "player"]["mana"]:
-                        new_world = copy.deepcopy(best_world)
-                        new_until = pick(**new_world)
-                        new_world["player"]["spells"][idx] = (new_until,
-                                                              spell_cost, pick)
-                        new_world["player"]['mana'] -= spell_cost
-
-                        new_mana_cost = mana_cost + spell_cost
-                        new_mana_cost += random.random(
-                        ) / 1e3  # Make every value unique
-                        if new_world["boss"]["hit_points"] <= 0:
-                            return new_mana_cost
-                        else:
-                            heapq.heappush(moves, (new_mana_cost, new_world))
-
-    return search(world), search(world, hard_mode)
-
-
-def solve_day_23():
-    def load_program(file_name):
+                for spell, spell_cost in enumerate(spell_costs):
+                    if spells[spell] <= timer and spell_cost < mana:
+                        yield spell_cost, cast(spell, timer, hit_points, mana,
+                                               armor, boss_hit_points, spells,
+                                               effects)
+
+        return next_worlds
+
+    def won(penalty):
+        def is_won(world):
+            timer, hit_points, _, _, boss_hit_points, _, _ = world
+            if timer % 2 == 0:
+                # Just cast a spell.
+                return boss_hit_points <= 0
+            # After the boss, the player still has to survive the penalty.
+            return boss_hit_points < 0 and hit_points - penalty > 0
+
+        return is_won
+
+    return (search.dijkstra(world, turns(0), won(0)),
+            search.dijkstra(world, turns(1), won(1)))
+
+
+def solve_day_23(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_23.txt"))
+
+    def load_program():
         def tokenize(line):
             return line.split(" ")
 
-        with open(get_filepath(file_name), "r") as f:
-            return [tokenize(line.strip()) for line in f]
+        lines = inputs.lines(puzzle_input)
+        return [tokenize(line.strip()) for line in lines]
 
     def evaluate(program, state):
         while True:
@@ -190,7 +167,7 @@ def solve_day_23():
                 print(f"Unknown instruction: {inst}")
                 return
 
-    program = load_program("day_23.txt")
+    program = load_program()
     first_state = {"a": 0, "b": 0, "prog_counter": 0}
     second_state = {"a": 1, "b": 0, "prog_counter": 0}
 
@@ -198,10 +175,11 @@ def solve_day_23():
                     first_state)["b"], evaluate(program, second_state)["b"]
 
 
-def solve_day_24():
+def solve_day_24(puzzle_input=None):
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_24.txt"))
+
     def load_weights():
-        with open(get_filepath("day_24.txt"), "r") as f:
-            return [int(line) for line in f]
+        return [int(line) for line in inputs.lines(puzzle_input)]
 
     def search_for(target_weight, n_packets, weights, stop_first=True):
         solutions = []
@@ -252,7 +230,7 @@ def solve_day_24():
     return quantum_entanglement(part_a[0]), quantum_entanglement(part_b[0])
 
 
-def solve_day_25():
+def solve_day_25(puzzle_input=None):
     def start_column():
         value = 1
         inc = 1
@@ -292,7 +270,13 @@ def solve_day_25():
             pass
         return val
 
-    return get_hash(3075, 2981)
+    # get_hash swapped the meaning of row and column.
+    code_row, code_column = 2981, 3075
+    if puzzle_input is not None:
+        text = inputs.read_text(puzzle_input)
+        matched = re.search(r"row (\d+), column (\d+)", text)
+        code_row, code_column = int(matched.group(1)), int(matched.group(2))
+    return get_hash(code_column, code_row)
 
 
 def solve():
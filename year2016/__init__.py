@@ -12,10 +12,11 @@
   (with the main intention to have project stay a fun excercise.)
 
 """
-from .week1 import solve as solve_week_1
-from .week2 import solve as solve_week_2
 
 
 def solve():
+    from .week1 import solve as solve_week_1
+    from .week2 import solve as solve_week_2
+
 #    solve_week_1()
     solve_week_2()
@@ -1,20 +1,24 @@
 import collections
-import hashlib
 import re
 import copy
 import itertools
 import pathlib
 
+from aoc import checkpoint
+from aoc import inputs
+from aoc import memo
+from aoc import md5mining
+
 
 def get_filepath(file_name):
     """ Returns the full path of the file_name"""
     return pathlib.Path(__file__).parent.joinpath(file_name).resolve()
 
 
-def solve_day_1_part_ab():
+def solve_day_1_part_ab(puzzle_input=None):
     """ Finding the route to the Easter Bunny Headquarters """
-    with open(get_filepath("day_1.txt"), "r") as f:
-        line = f.read()
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_1.txt"))
+    line = inputs.read_text(puzzle_input)
 
     def split(directive):
         return directive[:1], int(directive[1:])
@@ -75,10 +79,12 @@ def solve_day_1_part_ab():
     return distance(*travel(sample)), distance(*travel_without_repeat(sample))
 
 
-def solve_day_2_part_ab():
+def solve_day_2_part_ab(puzzle_input=None):
     """ Keycodes to the Bathroom """
-    with open(get_filepath("day_2.txt"), "r") as f:
-        instructions = [line.strip() for line in f]
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_2.txt"))
+    instructions = [
+        line.strip() for line in inputs.lines(puzzle_input)
+    ]
 
     keypad_part1 = {
         (0, 0): 1,
@@ -137,14 +143,16 @@ def solve_day_2_part_ab():
                                                        start=(0, 2))
 
 
-def solve_day_3_part_ab():
+def solve_day_3_part_ab(puzzle_input=None):
     """ Triangles on the walls of the Graphic design department """
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_3.txt"))
+
     def split_triangle(line):
         string_edges = filter(lambda x: x, line.split(" "))
         return [int(d) for d in string_edges]
 
-    with open(get_filepath("day_3.txt"), "r") as f:
-        triangles = [split_triangle(line) for line in f]
+    lines = inputs.lines(puzzle_input)
+    triangles = [split_triangle(line) for line in lines]
 
     def is_triangle(edges):
         for a, b, c in itertools.permutations(edges):
@@ -172,10 +180,12 @@ def solve_day_3_part_ab():
         map(is_triangle, rotate_triangle_list(triangles)))
 
 
-def solve_day_4_part_ab():
+def solve_day_4_part_ab(puzzle_input=None):
     """ Finding the right room """
-    with open(get_filepath("day_4.txt"), "r") as f:
-        instructions = [line.strip() for line in f]
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_4.txt"))
+    instructions = [
+        line.strip() for line in inputs.lines(puzzle_input)
+    ]
 
     def split(line):
         parts = line.split("-")
@@ -233,26 +243,34 @@ def solve_day_4_part_ab():
     return count_valid(rooms), search_north_pole_sector(rooms)
 
 
-def solve_day_5():
+# Interesting hashes per salt. Kept between calls, so a long running
+# process (like the daemon) only mines each salt once.
+_interesting_hashes = memo.lru("2016/5 interesting hashes", max_entries=64)
+
+
+def solve_day_5(puzzle_input=None):
     """ Decoding the password  """
-    import hashlib
     salt = b"reyedfim"
+    if puzzle_input is not None:
+        salt = inputs.read_text(puzzle_input).strip().encode()
 
-    cache = {}
+    name = checkpoint.checkpoint_name("2016/5", salt)
+    # The memo holds an immutable snapshot, mined into a copy.
+    cache = dict(_interesting_hashes.get(salt, ()))
+    if not cache:
+        cache = checkpoint.load(name) or {}
+    offer = checkpoint.periodic(name)
 
     def generate_hashes():
-        base = hashlib.md5(salt, usedforsecurity=False)
-        idx = 0
+        idx = -1
         for idx, hex_vals in sorted(cache.items()):
             yield hex_vals
 
-        for idx in itertools.count(idx):
-            extra = base.copy()
-            extra.update(str(idx).encode())
-            hex_vals = extra.hexdigest()
-            if hex_vals.startswith("00000"):
-                cache[idx] = hex_vals
-                yield hex_vals
+        for idx, digest in md5mining.mine(salt, 5, start=idx + 1):
+            hex_vals = digest.hex()
+            cache[idx] = hex_vals
+            offer(lambda: dict(cache))
+            yield hex_vals
 
     def first_key_code():
         key_code = ""
@@ -275,13 +293,18 @@ def solve_day_5():
             if NOT_DISCOVERED not in key_code:
                 return "".join(key_code)
 
-    return first_key_code(), second_key_code()
+    codes = first_key_code(), second_key_code()
+    _interesting_hashes.put(salt, tuple(sorted(cache.items())))
+    checkpoint.remove(name)
+    return codes
 
 
-def solve_day_6():
+def solve_day_6(puzzle_input=None):
     """ Unjamming the signal """
-    with open(get_filepath("day_6.txt"), "r") as f:
-        rx_words = [line.strip() for line in f]
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_6.txt"))
+    rx_words = [
+        line.strip() for line in inputs.lines(puzzle_input)
+    ]
 
     def letter_distributions(words):
         letter_distributions = collections.defaultdict(collections.Counter)
@@ -311,8 +334,10 @@ def solve_day_6():
     return most_common_letters(rx_letters), least_common_letters(rx_letters)
 
 
-def solve_day_7():
+def solve_day_7(puzzle_input=None):
     """ IP addresses of the Easter Bunny Headquarters"""
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_7.txt"))
+
     def split_address(addr):
         results = []
         current = ""
@@ -359,8 +384,8 @@ def solve_day_7():
                         return True
         return False
 
-    with open(get_filepath("day_7.txt"), "r") as f:
-        addresses = [split_address(line.strip()) for line in f]
+    lines = inputs.lines(puzzle_input)
+    addresses = [split_address(line.strip()) for line in lines]
 
     return sum(map(is_transport_snoopable,
                    addresses)), sum(map(suppots_secret_listening, addresses))
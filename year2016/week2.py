@@ -2,95 +2,72 @@ import collections
 import re
 import itertools
 import pathlib
-import heapq
 import math
 
+from aoc import inputs
+from aoc import memo
+from aoc import parsing
+from aoc import search
+
 
 def get_filepath(file_name):
     """ Returns the full path of the file_name"""
     return pathlib.Path(__file__).parent.joinpath(file_name).resolve()
 
 
-def solve_day_8():
+_lcd_instructions = parsing.grammar(
+    r"^(rect|rotate row|rotate column) (?:[xy]=)?(\d+)(?:x| by )(\d+)",
+    None, int, int)
+
+
+def solve_day_8(puzzle_input=None):
     """ Decoding the broken LCD """
-    with open(get_filepath("day_8.txt"), "r") as f:
-        instructions = [line.strip() for line in f]
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_8.txt"))
+
+    from aoc import grid
 
     wide = 50
     tall = 6
-    lcd = [False] * (wide * tall)
-
-    def as_text(lcd):
-        """ Helps with debugging and the 2nd part"""
-        txt = ""
-        for y in range(tall):
-            row_str = ""
-            for x in range(wide):
-                if get_pixel(lcd, x, y):
-                    row_str += "#"
-                else:
-                    row_str += "."
-            txt += row_str + "\n"
-        return txt
-
-    def get_pixel(lcd, x, y):
-        return lcd[x + y * wide]
-
-    def put_pixel(lcd, x, y, val):
-        lcd[x + y * wide] = val
-        return val
+    lcd = grid.new(wide, tall)
 
     def rect(a, b):
-        for x in range(a):
-            for y in range(b):
-                put_pixel(lcd, x, y, True)
+        grid.assign(lcd, (0, 0), (a - 1, b - 1), True)
 
     def rotate_by_column(x, amt):
-        orig_lcd = list(lcd)
-        for y in range(tall):
-            src_val = get_pixel(orig_lcd, x, (y - amt) % tall)
-            put_pixel(lcd, x, y, src_val)
+        grid.roll_column(lcd, x, amt)
 
     def rotate_by_row(y, amt):
-        orig_lcd = list(lcd)
-        for x in range(wide):
-            src_val = get_pixel(orig_lcd, (x - amt) % wide, y)
-            put_pixel(lcd, x, y, src_val)
+        grid.roll_row(lcd, y, amt)
 
-    def eval_instruction(line):
-        rect_instr = "rect (\d+)x(\d+)"
-        col_rotate = "rotate column x=(\d+) by (\d+)"
-        row_rotate = "rotate row y=(\d+) by (\d+)"
+    operations = {
+        "rect": rect,
+        "rotate row": rotate_by_row,
+        "rotate column": rotate_by_column,
+    }
+    for operation, first, second in parsing.records(puzzle_input,
+                                                    _lcd_instructions):
+        operations[operation](first, second)
 
-        if rect_val := re.match(rect_instr, line):
-            a, b = rect_val.groups()
-            rect(int(a), int(b))
-        elif row_val := re.match(row_rotate, line):
-            y, amt = row_val.groups()
-            rotate_by_row(int(y), int(amt))
-        elif col_val := re.match(col_rotate, line):
-            x, amt = col_val.groups()
-            rotate_by_column(int(x), int(amt))
+    return int(lcd.sum()), grid.as_text(lcd)
 
-    for ins in instructions:
-        eval_instruction(ins)
 
-    return sum(lcd), as_text(lcd)
+# Expanded lengths of the fragments of day 9, independent of the
+# input. Kept between calls to stay warm in a long running process.
+# A solve needs a few hundred of them.
+_expansions = memo.lru("2016/9 expansions", max_entries=4096,
+                       max_bytes=64 * 1024 * 1024)
 
 
-def solve_day_9():
+def solve_day_9(puzzle_input=None):
     """ decompressing the text """
-    with open(get_filepath("day_9.txt"), "r") as f:
-        text = next(f).strip()
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_9.txt"))
+    text = inputs.lines(puzzle_input)[0].strip()
 
     def uncompress(initial_txt, inner):
         """ Taking the state machine approach. 
           The inner argumetn is called each time one
           of the inner values are expanded.
 
-          This allows to solve the 2nd part of the riddle
-          fairly cleanly.
-
           returns fragments of the uncompressed string.
           Joined together these are these are the full 
           decompressed text.
@@ -130,7 +107,7 @@ def solve_day_9():
             if range_cnt == 1:
                 final = (inner(collected) for _ in range(repeat))
 
-                return itertools.chain(*final), handle_char, ''
+                return itertools.chain.from_iterable(final), handle_char, ''
             else:
                 data = (range_cnt - 1, repeat, collected)
                 return EMPTY_OUT, handle_collect, data
@@ -143,54 +120,59 @@ def solve_day_9():
     def no_expand(vals):
         return iter(vals)
 
-    cache = {}
-
-    def recurse_expand(rr):
-        """ Recursively go deeper if the input has more
+    cache = _expansions
 
-          Using a cache to efficiently deal with all
-          the repeated values.
+    def expanded_length(rr):
+        """ Length of rr with every marker expanded recursively.
 
-          Major constraint is trying avoid letting the 
-          memory grow too much out of bounds.
+          Only the lengths are needed, the expanded text runs into
+          gigabytes. The lengths of the repeated fragments are
+          remembered.
       """
-        if rr in cache:
-            return iter((cache[rr], ))
-        elif '(' in rr:
-            if len(cache) > 1024:
-                cache.clear()
-            max_size = 16 * 1024
-            elements = [
-                ch for idx, ch in zip(range(max_size),
-                                      uncompress(rr, recurse_expand))
-            ]
-
-            if len(elements) == max_size:
-                return uncompress(rr, recurse_expand)
-            else:
-                elements = ''.join(elements)
-                cache[rr] = elements
-                return iter((elements, ))
-        else:
-            return iter((rr, ))
+        if '(' not in rr:
+            return len(rr)
+        cached = cache.get(rr)
+        if cached is not None:
+            return cached
+
+        length = 0
+        idx = 0
+        while (marker := rr.find('(', idx)) != -1:
+            length += marker - idx
+            end = rr.find(')', marker)
+            if end == -1:
+                # Like uncompress, an unfinished marker is dropped.
+                idx = len(rr)
+                break
+            range_cnt, repeat = map(int, rr[marker + 1:end].split('x'))
+            idx = end + 1 + range_cnt
+            if idx > len(rr):
+                break
+            length += repeat * expanded_length(rr[end + 1:idx])
+        length += max(0, len(rr) - idx)
+        cache.put(rr, length)
+        return length
 
     def part_one(text):
         full_text = list(uncompress(text, no_expand))
         return len(full_text)
 
     def part_two(text):
-        expanded = 0
-        for fragment in uncompress(text, recurse_expand):
-            expanded += len(fragment)
-        return expanded
+        return expanded_length(text)
 
     return part_one(text), part_two(text)
 
 
-def solve_day_10():
+# Either a value for a bot, or where a bot hands its chips to.
+_bot_instructions = parsing.grammar(
+    r"^(?:value (\d+) goes to bot (\d+)|bot (\d+) gives low to (output|bot) "
+    r"(\d+) and high to (output|bot) (\d+))",
+    int, None, None, None, None, None, None)
+
+
+def solve_day_10(puzzle_input=None):
     """ Robots distributing chips """
-    with open(get_filepath("day_10.txt"), "r") as f:
-        instructions = [line.strip() for line in f]
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_10.txt"))
 
     class Bot:
         """ Values and instructions for the Bot.
@@ -227,25 +209,19 @@ def solve_day_10():
         def __str__(self):
             return f"Bot has {self.values} and {self.outputs}"
 
-    def decode_instruction(line, bots):
-        goes_to = "value (\d+) goes to bot (\d+)"
-        hand_over = "bot (\d+) gives low to (output|bot) (\d+) and high to (output|bot) (\d+)"
-
-        if res := re.match(goes_to, line):
-            val, bot_idx = res.groups()
-            bots[bot_idx].append(int(val))
-        elif res := re.match(hand_over, line):
-            bot_idx, low_type, low_idx, high_type, high_idx = res.groups()
-            bots[bot_idx].instruction((low_type, low_idx),
-                                      (high_type, high_idx))
-            pass
+    def decode_instruction(instruction, bots):
+        val, bot_idx, giver_idx, *hand_over = instruction
+        if val is not None:
+            bots[bot_idx].append(val)
         else:
-            print(f"Not decoded: {line}")
+            low_type, low_idx, high_type, high_idx = hand_over
+            bots[giver_idx].instruction((low_type, low_idx),
+                                        (high_type, high_idx))
 
     bots = collections.defaultdict(Bot)
     outputs = collections.defaultdict(list)
-    for l in instructions:
-        decode_instruction(l, bots)
+    for instruction in parsing.records(puzzle_input, _bot_instructions):
+        decode_instruction(instruction, bots)
 
     acted = True
     responsible = None
@@ -266,7 +242,7 @@ def solve_day_10():
     return responsible, multiply(*(outputs["0"] + outputs["1"] + outputs["2"]))
 
 
-def solve_day_11():
+def solve_day_11(puzzle_input=None):
     """ Safely bringing the microchips up """
 
     # Asigned unique powers of 2 to each type.
@@ -278,8 +254,6 @@ def solve_day_11():
     strontium = 16
     promethium = 32
     ruthenium = 64
-    elerium = 128
-    dilithium = 256
 
     def input_part_a():
         initial_floor_1 = set(
@@ -297,135 +271,121 @@ def solve_day_11():
                          initial_floor_4)
         return initial_state
 
-    def input_part_b():
-        state = input_part_a()
+    def read_floors(text):
+        """ Floors as described in the puzzle text.
+
+            Every element gets the next free power of 2.
+        """
+        elements = {}
+        floors = []
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            floor = set()
+            for element, kind in re.findall(
+                    r"(\w+?)(?:-compatible)? (generator|microchip)", line):
+                if element not in elements:
+                    elements[element] = 4 << len(elements)
+                part = generator if kind == "generator" else microchip
+                floor.add(elements[element] | part)
+            floors.append(floor)
+        return tuple(floors)
+
+    def input_part_b(part_a):
+        state = tuple(set(floor) for floor in part_a)
+        used = 0
+        for floor in state:
+            for part in floor:
+                used |= part
+        # The next free powers of 2 (128 and 256 for my input)
+        elerium = 1 << used.bit_length()
+        dilithium = elerium << 1
         state[0].add((elerium | generator))
         state[0].add((elerium | microchip))
         state[0].add((dilithium | generator))
         state[0].add((dilithium | microchip))
         return state
 
-    def is_safe_floor(floor):
-        chips = 0
-        generators = 0
-        for part in floor:
-            if (part & microchip) > 0:
-                chips = chips | part
-            else:
-                generators = generators | part
-
-        if generators == 0:
-            return True
-
-        chips = chips >> 2
-        generators = generators >> 2
-        unprotected = chips & ~generators
-        return unprotected <= 0
-
-    def is_safe(world):
-        for floor in world:
-            if not is_safe_floor(floor):
-                return False
-        return True
-
-    def is_solved(world):
-        for lower_floor in world[:3]:
-            if len(lower_floor) > 0:
-                return False
-        top_floor = world[3]
-        return len(top_floor) > 0
-
-    def next_steps(elevator, world):
+    def as_pairs(floors):
+        """ Per element the floors of its generator and its microchip.
+
+            Elements are interchangeable, swapping two of them gives
+            as many steps. So only the sorted pairs are kept.
+        """
+        pairs = collections.defaultdict(lambda: [0, 0])
+        for level, floor in enumerate(floors):
+            for part in floor:
+                element = part & ~(generator | microchip)
+                is_chip = 1 if part & microchip else 0
+                pairs[element][is_chip] = level
+        return tuple(sorted(tuple(pair) for pair in pairs.values()))
+
+    def is_safe(pairs):
+        """ A microchip only shares a floor with other generators
+            when its own generator is there too.
+        """
+        generator_floors = {gen_floor for gen_floor, _ in pairs}
+        return all(chip_floor == gen_floor or chip_floor not in generator_floors
+                   for gen_floor, chip_floor in pairs)
+
+    def is_solved(state):
+        _, pairs = state
+        return all(pair == (3, 3) for pair in pairs)
+
+    def next_steps(state):
         """ Only generates next valid steps """
-        def copy_world():
-            # Explict 4 levels, because it made a large difference to performance.
-            return (set(world[0]), set(world[1]), set(world[2]), set(world[3]))
-
-        def change(next_floor):
-            start = world[elevator]
-
-            ## single element moves
-            for el in start:
-                a_result = copy_world()
-                current_floor = a_result[elevator]
-                target_floor = a_result[next_floor]
-
-                current_floor.remove(el)
-                target_floor.add(el)
-                if is_safe_floor(current_floor) and is_safe_floor(
-                        target_floor):
-                    yield (next_floor, a_result)
-
-            ## double element moves
-            for el1, el2 in itertools.combinations(start, 2):
-                a_result = copy_world()
-                current_floor = a_result[elevator]
-                target_floor = a_result[next_floor]
-
-                current_floor.remove(el1)
-                current_floor.remove(el2)
-                if not is_safe_floor(current_floor):
-                    continue
-
-                target_floor.add(el1)
-                target_floor.add(el2)
-                if is_safe_floor(target_floor):
-                    yield (next_floor, a_result)
-
-        if elevator != 0:
-            yield from change(elevator - 1)
-        if elevator != 3:
-            yield from change(elevator + 1)
-
-    def freeze_world(elevator, floors):
-        """ Freeze the world to make it easier find back. """
-        res = []
-
-        def freeze_floor(floor):
-            yield from sorted(floor)
-            # As stop marker.
-            yield 0
-
-        for a_floor in floors:
-            res.extend(freeze_floor(a_floor))
-
-        return (elevator, *res)
+        elevator, pairs = state
+        movable = [(idx, is_chip) for idx, pair in enumerate(pairs)
+                   for is_chip in (0, 1) if pair[is_chip] == elevator]
+
+        for next_floor in (elevator - 1, elevator + 1):
+            if not 0 <= next_floor <= 3:
+                continue
+            for many in (1, 2):
+                for moved in itertools.combinations(movable, many):
+                    next_pairs = [list(pair) for pair in pairs]
+                    for idx, is_chip in moved:
+                        next_pairs[idx][is_chip] = next_floor
+                    if is_safe(next_pairs):
+                        yield 1, (next_floor,
+                                  tuple(sorted(map(tuple, next_pairs))))
+
+    def freeze_world(state):
+        """ The state packed in a single int, 2 bits per floor. """
+        elevator, pairs = state
+        return search.pack(itertools.chain((elevator, ), *pairs), 2)
+
+    def min_remaining_steps(state):
+        _, pairs = state
+        per_floor = collections.Counter(itertools.chain(*pairs))
+        return sum(
+            math.ceil(per_floor[level] / 2) * (3 - level)
+            for level in range(3))
 
     def search_pathlength(initial_state):
         """ A-star search approach.
           Guaranteed to find a correct match thanks
           to an admissable heuristic
       """
-        def min_remaining_steps(floors):
-            min_cost = 0
-            for lvl, a_floor in enumerate(floors[:3], start=1):
-                min_cost += math.ceil(len(a_floor) / 2) * (4 - lvl)
-            return min_cost
-
-        search = [(min_remaining_steps(initial_state), 0, (0, initial_state))]
-        seen = set(freeze_world(1, initial_state))
-        while search:
-            estimated, steps, (elevator, state) = heapq.heappop(search)
-
-            next_steps_cnt = steps + 1
-            for next_el, next_state in next_steps(elevator, state):
-                if is_solved(next_state):
-                    return next_steps_cnt
-                if (frozen := freeze_world(next_el, next_state)) not in seen:
-                    seen.add(frozen)
-                    heapq.heappush(search, (
-                        min_remaining_steps(next_state) + next_steps_cnt,
-                        next_steps_cnt,
-                        (next_el, next_state),
-                    ))
-
-    return search_pathlength(input_part_a()), search_pathlength(input_part_b())
-
-
-def solve_day_12():
+        return search.astar((0, as_pairs(initial_state)), next_steps,
+                            is_solved, min_remaining_steps, freeze_world,
+                            label="2016/11 states")
+
+    initial_state = input_part_a()
+    if puzzle_input is not None:
+        initial_state = read_floors(inputs.read_text(puzzle_input))
+    return search_pathlength(initial_state), search_pathlength(
+        input_part_b(initial_state))
+
+
+_assembunny = parsing.grammar(
+    r"^(cpy|inc|dec|jnz) (-?\d+|[abcd])(?: (-?\d+|[abcd]))?", None, None, None)
+
+
+def solve_day_12(puzzle_input=None):
     """ Running the program """
-    with open(get_filepath("day_12.txt"), "r") as f:
-        instructions = [line.strip() for line in f]
+    puzzle_input = inputs.source(puzzle_input, get_filepath("day_12.txt"))
+    instructions = parsing.records(puzzle_input, _assembunny, persist=True)
 
     registers = {"a": 0, "b": 0, "c": 0, "d": 0}
 
@@ -437,12 +397,8 @@ def solve_day_12():
 
         """
         # Using many inner fucntions to accomplish this compilation 
-        cpy_inst = "cpy (\d+|[abcd]) ([abcd])"
-        inc_inst = "inc ([abcd])"
-        dec_inst = "dec ([abcd])"
-        jnz_inst = "jnz (\d+|[abcd]) (-*\d+)"
-        if cpy_val := re.match(cpy_inst, inst):
-            src, dest = cpy_val.groups()
+        name, src, dest = inst
+        if name == "cpy":
             def cpy_regist(registers):
                 registers[dest] = registers[src]
                 return 1
@@ -453,20 +409,17 @@ def solve_day_12():
                 return cpy_regist
             else:
                 return cpy_val
-        elif inc_val := re.match(inc_inst, inst):
-            src, = inc_val.groups()
+        elif name == "inc":
             def inc_action(registers):
               registers[src] += 1
               return 1
             return inc_action
-        elif dec_val := re.match(dec_inst, inst):
-            src, = dec_val.groups()
+        elif name == "dec":
             def dec_action(registers):
               registers[src] -= 1
               return 1
             return dec_action
-        elif jnz_val := re.match(jnz_inst, inst):
-            src, dest = jnz_val.groups()
+        elif name == "jnz":
             def register_jump(registers):
                 if registers[src] == 0:
                   return 1
@@ -510,7 +463,6 @@ def solve_day_12():
 
 
 def solve():
-    import cProfile
     day8_a, day8_b = solve_day_8()
     print(f"Day8a: There would {day8_a} pixels lit")
     print(f"Day8b: There lcd looks like \n {day8_b}")